@@ -7,7 +7,7 @@ from typing import Optional
 
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import QDir, Qt
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmapCache
 
 from ui.main_window import MainWindow
 from ui.modern_styles import apply_modern_style
@@ -39,6 +39,9 @@ def setup_application() -> QApplication:
         # These attributes might not exist in newer Qt versions
         pass
     
+    # Room for cached icon pixmaps (limit is in KB), scaled for HiDPI screens
+    QPixmapCache.setCacheLimit(int(32 * 1024 * app.devicePixelRatio()))
+    
     return app
 
 
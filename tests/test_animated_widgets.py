@@ -0,0 +1,84 @@
+"""Tests for the shared animation clock and animated widgets."""
+
+import pytest
+import numpy as np
+
+from ui.animated_widgets import AnimationClock, WaveformVisualizer, _wave_kernel
+
+
+@pytest.fixture
+def clock(qtbot):
+    """Fresh clock so tests don't share subscribers with the global one."""
+    return AnimationClock()
+
+
+class TestAnimationClock:
+    """Test the shared timer's subscriber bookkeeping."""
+    
+    def test_idle_clock_is_stopped(self, clock):
+        """Test the timer doesn't run without subscribers."""
+        assert not clock._timer.isActive()
+    
+    def test_subscribe_starts_timer(self, clock):
+        """Test the first subscriber starts the timer."""
+        clock.subscribe(lambda frame: None)
+        
+        assert clock._timer.isActive()
+        assert clock._timer.interval() == clock.INTERVAL_MS
+    
+    def test_timer_stops_at_zero_subscribers(self, clock):
+        """Test the timer keeps running until the last subscriber leaves."""
+        first, second = (lambda frame: None), (lambda frame: None)
+        clock.subscribe(first)
+        clock.subscribe(second)
+        
+        clock.unsubscribe(first)
+        assert clock._timer.isActive()
+        
+        clock.unsubscribe(second)
+        assert not clock._timer.isActive()
+    
+    def test_tick_reaches_subscribers(self, clock, qtbot):
+        """Test subscribers receive increasing frame numbers."""
+        frames = []
+        clock.subscribe(frames.append)
+        
+        qtbot.waitUntil(lambda: len(frames) >= 2)
+        clock.unsubscribe(frames.append)
+        
+        assert frames[1] > frames[0]
+
+
+class TestWaveformVisualizer:
+    """Test the waveform bar heights."""
+    
+    def test_wave_kernel_clips(self):
+        """Test the kernel clips heights into 10..80 in place."""
+        out = np.empty(3, dtype=np.float32)
+        wave = np.array([-30.0, 0.0, 30.0], dtype=np.float32)
+        base = np.array([0, 10, 20], dtype=np.int16)
+        
+        result = _wave_kernel(wave, base, out)
+        
+        assert result is out
+        np.testing.assert_allclose(out, [10.0, 30.0, 70.0])
+    
+    def test_update_bars_stays_in_range(self, qtbot):
+        """Test bars stay within 10..80 over several wave periods."""
+        widget = WaveformVisualizer()
+        qtbot.addWidget(widget)
+        widget.show()
+        qtbot.waitExposed(widget)
+        
+        for _ in range(3 * widget.SIN_TABLE_FRAMES):
+            widget.update_bars()
+            assert widget.bars.min() >= 10
+            assert widget.bars.max() <= 80
+        
+        assert widget._frame_idx == 0
+    
+    def test_sin_table_spans_one_period(self):
+        """Test the sine table wraps back to its first row."""
+        step = 2 * np.pi / WaveformVisualizer.SIN_TABLE_FRAMES
+        
+        assert abs(step - WaveformVisualizer.PHASE_STEP) < 0.01
@@ -0,0 +1,20 @@
+"""Tests for batch processor helpers."""
+
+import pytest
+
+from ui.batch_processor import BatchProcessorWidget
+
+
+class TestFormatDuration:
+    """Test BatchProcessorWidget._fmt_duration."""
+    
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "0s"),
+        (42.9, "42s"),
+        (60, "60s"),
+        (65, "1m 5s"),
+        (3600, "60m 0s"),
+    ])
+    def test_fmt_duration(self, seconds, expected):
+        """Test seconds and minute formatting around the one-minute boundary."""
+        assert BatchProcessorWidget._fmt_duration(seconds) == expected
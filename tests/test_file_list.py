@@ -0,0 +1,98 @@
+"""Tests for the file list model and widget."""
+
+import pytest
+from pathlib import Path
+
+from core.pipeline import ProcessingJob, ProcessingStage
+from ui.file_list import FileListModel, FileListWidget
+
+
+@pytest.fixture
+def media_files(tmp_path):
+    """Create a few files on disk, media and non-media."""
+    paths = {}
+    for name in ("a.wav", "b.MP3", "c.mp4", "notes.txt"):
+        path = tmp_path / name
+        path.write_bytes(b"")
+        paths[name] = path
+    return paths
+
+
+@pytest.fixture
+def file_list(qtbot):
+    """File list widget registered with qtbot."""
+    widget = FileListWidget()
+    qtbot.addWidget(widget)
+    return widget
+
+
+class TestFileListWidget:
+    """Test adding files through the widget."""
+    
+    def test_add_files(self, file_list, media_files):
+        """Test supported files are added in order."""
+        paths = [media_files["a.wav"], media_files["b.MP3"], media_files["c.mp4"]]
+        file_list.add_files(paths)
+        
+        assert file_list.get_all_files() == paths
+    
+    def test_add_files_deduplicates(self, file_list, media_files):
+        """Test files already listed or repeated in a batch are skipped."""
+        wav = media_files["a.wav"]
+        file_list.add_files([wav, wav])
+        file_list.add_files([wav])
+        
+        assert file_list.get_all_files() == [wav]
+    
+    def test_add_files_rejects_unsupported_and_missing(self, file_list, media_files, tmp_path):
+        """Test unsupported suffixes and missing files are skipped."""
+        file_list.add_files([media_files["notes.txt"], tmp_path / "missing.wav"])
+        
+        assert file_list.get_all_files() == []
+    
+    def test_add_files_emits_count(self, file_list, media_files):
+        """Test files_changed reports the new row count once per batch."""
+        counts = []
+        file_list.files_changed.connect(counts.append)
+        
+        file_list.add_files([media_files["a.wav"], media_files["c.mp4"]])
+        file_list.add_files([media_files["notes.txt"]])
+        
+        assert counts == [2]
+
+
+class TestFileListModel:
+    """Test the list model bookkeeping."""
+    
+    def test_remove_paths_reindexes(self, qtbot):
+        """Test rows after a removed file keep a correct index."""
+        model = FileListModel()
+        paths = [Path(f"/media/{name}.wav") for name in "abcd"]
+        model.add_files(paths)
+        
+        assert model.remove_paths([paths[1], Path("/media/other.wav")]) == 1
+        assert [record.path for record in model.records()] == [paths[0], paths[2], paths[3]]
+        assert model.contains(paths[3])
+        assert not model.contains(paths[1])
+    
+    def test_update_job_skips_unchanged(self, qtbot):
+        """Test dataChanged fires only when the visible job state changes."""
+        model = FileListModel()
+        path = Path("/media/a.wav")
+        model.add_files([path])
+        
+        changed = []
+        model.dataChanged.connect(lambda *args: changed.append(args))
+        
+        job = ProcessingJob(input_path=path)
+        job.stage = ProcessingStage.NOISE_REDUCTION
+        job.progress = 0.501
+        model.update_job(path, job)
+        
+        job.progress = 0.504  # Same whole percent
+        model.update_job(path, job)
+        
+        job.progress = 0.52
+        model.update_job(path, job)
+        
+        assert len(changed) == 2
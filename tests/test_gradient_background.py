@@ -0,0 +1,88 @@
+"""Tests for the animated gradient background widgets."""
+
+import pytest
+import numpy as np
+
+from ui.gradient_background import GradientBackgroundWidget, FloatingOrb
+
+
+@pytest.fixture
+def background(qtbot):
+    """Background widget with its timers stopped so tests drive it manually."""
+    widget = GradientBackgroundWidget()
+    qtbot.addWidget(widget)
+    widget.stop_animation()
+    widget.resize(400, 300)
+    return widget
+
+
+class TestGradientBackgroundParticles:
+    """Test the particle slot bookkeeping."""
+    
+    def test_initial_particles(self, background):
+        """Test initial spawn fills slots from the free list."""
+        alive = int(background._alive.sum())
+        assert alive > 0
+        assert alive + len(background._free_slots) == background.MAX_PARTICLES
+    
+    def test_spawn_is_capped_by_free_slots(self, background):
+        """Test spawning never exceeds the particle capacity."""
+        background.spawn_particles(background.MAX_PARTICLES * 2)
+        
+        assert background._alive.all()
+        assert len(background._free_slots) == 0
+    
+    def test_expired_particles_are_released(self, background):
+        """Test particles past their lifetime return to the free list."""
+        background.spawn_particles(background.MAX_PARTICLES)
+        background._lifetime[:] = 100
+        background._age[:] = 0
+        
+        background.update_animation(dt=150)
+        
+        assert not background._alive.any()
+        assert len(background._free_slots) == background.MAX_PARTICLES
+    
+    def test_particles_fade_out(self, background):
+        """Test opacity falls over the last part of the lifetime."""
+        background._lifetime[:] = 1000
+        background._age[:] = 0
+        
+        background.update_animation(dt=500)
+        assert np.allclose(background._opacity, 1.0)
+        
+        background.update_animation(dt=350)
+        assert np.all(background._opacity < 1.0)
+        assert np.all(background._opacity > 0.0)
+    
+    def test_dot_alpha_follows_opacity(self, background):
+        """Test dots are drawn with the particle opacity as alpha."""
+        levels = background.ALPHA_LEVELS
+        full = background._dot(0, levels).toImage()
+        center = full.pixelColor(background.DOT_SIZE // 2, background.DOT_SIZE // 2)
+        
+        assert center.alpha() == 255
+        assert background._dot(0, levels) is background._dot(0, levels)
+
+
+class TestFloatingOrb:
+    """Test the pre-rendered orb glow."""
+    
+    def test_glow_frames(self, qtbot):
+        """Test one frame is rendered per glow step."""
+        orb = FloatingOrb(size=40)
+        qtbot.addWidget(orb)
+        
+        assert len(orb._glow_frames) == orb.GLOW_STEPS
+    
+    def test_intensity_property(self, qtbot):
+        """Test the intensity step maps onto the glow range."""
+        orb = FloatingOrb(size=40)
+        qtbot.addWidget(orb)
+        orb.stop_floating()
+        
+        orb.intensity = orb.GLOW_STEPS - 1
+        assert orb.glow_intensity == pytest.approx(1.0)
+        
+        orb.intensity = 0
+        assert orb.glow_intensity == pytest.approx(0.3)
@@ -0,0 +1,107 @@
+"""Tests for reading the log tail."""
+
+import pytest
+
+from ui.log_viewer import LogViewer
+
+
+@pytest.fixture
+def viewer(qtbot, tmp_path, monkeypatch):
+    """Log viewer started in an empty folder so it monitors nothing."""
+    monkeypatch.chdir(tmp_path)
+    widget = LogViewer()
+    qtbot.addWidget(widget)
+    yield widget
+    widget._close_log_file()
+
+
+def open_log(viewer, path, data):
+    """Write data to a log file and point the viewer's tail handle at it."""
+    path.write_bytes(data)
+    viewer._log_file = open(path, 'rb')
+    return len(data)
+
+
+class TestReadTail:
+    """Test LogViewer._read_tail."""
+    
+    def test_empty_file(self, viewer, tmp_path):
+        """Test an empty log yields no text."""
+        size = open_log(viewer, tmp_path / "app.log", b"")
+        assert viewer._read_tail(size) == ""
+    
+    def test_short_file_is_read_whole(self, viewer, tmp_path):
+        """Test a log shorter than max_lines comes back unchanged."""
+        data = b"one\ntwo\nthree\n"
+        size = open_log(viewer, tmp_path / "app.log", data)
+        
+        assert viewer._read_tail(size) == data.decode()
+    
+    def test_long_file_keeps_last_lines(self, viewer, tmp_path):
+        """Test only the last max_lines lines are returned from a long log."""
+        viewer.max_lines = 3
+        lines = [f"line {i:04d} " + "x" * 40 for i in range(500)]
+        size = open_log(viewer, tmp_path / "app.log", "\n".join(lines).encode() + b"\n")
+        
+        assert viewer._read_tail(size).splitlines() == lines[-3:]
+    
+    def test_partial_last_line_is_kept(self, viewer, tmp_path):
+        """Test text after the last newline is returned after the full lines."""
+        viewer.max_lines = 2
+        lines = [f"line {i}" for i in range(2000)]
+        size = open_log(viewer, tmp_path / "app.log", ("\n".join(lines) + "\npartial").encode())
+        
+        assert viewer._read_tail(size).split("\n") == lines[-2:] + ["partial"]
+    
+    def test_size_limits_read(self, viewer, tmp_path):
+        """Test bytes past the given size are ignored."""
+        data = b"one\ntwo\nthree\n"
+        open_log(viewer, tmp_path / "app.log", data + b"four\n")
+        
+        assert viewer._read_tail(len(data)) == data.decode()
+
+
+class TestUpdateLogs:
+    """Test LogViewer._update_logs."""
+    
+    def test_line_split_across_writes(self, viewer, tmp_path):
+        """Test a line ended by a newline-only write isn't glued to the next."""
+        path = tmp_path / "app.log"
+        path.write_bytes(b"")
+        viewer.log_file_path = path
+        
+        first = "2024-01-01 10:00:00 - app - INFO - first"
+        second = "2024-01-01 10:00:01 - app - INFO - second"
+        for chunk in (first, "\n", second + "\n"):
+            with open(path, "a") as f:
+                f.write(chunk)
+            viewer._update_logs()
+        
+        assert [line for line, _ in viewer._raw_lines] == [first, second]
+        assert viewer.log_text.toPlainText().split("\n") == [first, second]
+
+
+class TestRotation:
+    """Test the file watcher follows a rotated log."""
+    
+    def test_watcher_rearmed_after_rotation(self, viewer, tmp_path):
+        """Test the folder is watched while the log is missing, then the new file."""
+        path = tmp_path / "app.log"
+        viewer.log_file_path = path
+        
+        viewer._on_file_changed(str(path))
+        assert str(tmp_path) in viewer.file_watcher.directories()
+        
+        path.write_bytes(b"")
+        viewer._on_directory_changed(str(tmp_path))
+        assert str(path) in viewer.file_watcher.files()
+        assert not viewer.file_watcher.directories()
+    
+    def test_reopen_rearms_watcher(self, viewer, tmp_path):
+        """Test reopening the log adds it back to the watcher."""
+        path = tmp_path / "app.log"
+        path.write_bytes(b"")
+        viewer.log_file_path = path
+        
+        viewer._open_log_file()
+        assert str(path) in viewer.file_watcher.files()
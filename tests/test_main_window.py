@@ -0,0 +1,83 @@
+"""Tests for main window helpers."""
+
+import os
+import pytest
+from pathlib import Path
+
+from ui.main_window import _scan_media_files, _validate_path, _validated_paths
+
+
+class TestScanMediaFiles:
+    """Test the folder scan used by Add Folder."""
+    
+    def test_finds_media_recursively(self, tmp_path):
+        """Test media files in nested folders are found, others skipped."""
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        expected = {
+            tmp_path / "a.wav",
+            tmp_path / "sub" / "b.MP3",
+            tmp_path / "sub" / "deeper" / "c.mkv",
+        }
+        for path in expected:
+            path.write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        (tmp_path / "sub" / "cover.jpg").write_bytes(b"")
+        
+        assert set(_scan_media_files(tmp_path)) == expected
+    
+    def test_skips_media_named_directories(self, tmp_path):
+        """Test a directory with a media suffix is walked, not returned."""
+        folder = tmp_path / "album.wav"
+        folder.mkdir()
+        (folder / "track.flac").write_bytes(b"")
+        
+        assert _scan_media_files(tmp_path) == [folder / "track.flac"]
+    
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test symlinked directories are not walked."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "a.wav").write_bytes(b"")
+        
+        root = tmp_path / "root"
+        root.mkdir()
+        try:
+            os.symlink(outside, root / "link", target_is_directory=True)
+        except OSError:
+            pytest.skip("cannot create symlinks here")
+        
+        assert _scan_media_files(root) == []
+    
+    def test_missing_folder(self, tmp_path):
+        """Test a missing folder yields no files instead of raising."""
+        assert _scan_media_files(tmp_path / "missing") == []
+
+
+class TestValidatePath:
+    """Test the cached media path check."""
+    
+    def setup_method(self):
+        _validated_paths.clear()
+    
+    def test_accepts_existing_media(self, tmp_path):
+        """Test an existing media file validates."""
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"")
+        
+        assert _validate_path(str(path))
+    
+    def test_rejects_unsupported_suffix(self, tmp_path):
+        """Test a non-media file is rejected even if it exists."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"")
+        
+        assert not _validate_path(str(path))
+    
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test a file created after a failed check validates later."""
+        path = tmp_path / "export.wav"
+        assert not _validate_path(str(path))
+        
+        path.write_bytes(b"")
+        assert _validate_path(str(path))
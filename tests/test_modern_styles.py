@@ -0,0 +1,71 @@
+"""Tests for stylesheet loading and minification."""
+
+import pytest
+
+from ui.modern_styles import RESOURCES_DIR, _minify, load_stylesheet
+
+
+class TestMinify:
+    """Test stylesheet minification."""
+    
+    def test_strips_comments_and_whitespace(self):
+        """Test comments and indentation are removed."""
+        qss = """
+        /* Buttons */
+        QPushButton {
+            color: white;
+            padding: 4px 8px;
+        }
+        """
+        assert _minify(qss) == "QPushButton{color:white;padding:4px 8px;}"
+    
+    def test_keeps_descendant_selector_spaces(self):
+        """Test the space between descendant selectors survives."""
+        qss = "#fileQueue   QListView::item:hover {\n    background: red;\n}"
+        assert _minify(qss) == "#fileQueue QListView::item:hover{background:red;}"
+    
+    def test_keeps_gradient_arguments(self):
+        """Test qlineargradient stops keep their value separators."""
+        qss = """
+        QMainWindow {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 #0a0e27, stop:1 #1e2139);
+        }
+        """
+        assert _minify(qss) == (
+            "QMainWindow{background:qlineargradient(x1:0,y1:0,x2:1,y2:1,"
+            "stop:0 #0a0e27,stop:1 #1e2139);}"
+        )
+    
+    def test_keeps_quoted_font_names(self):
+        """Test spaces inside quoted font names are kept."""
+        qss = "QWidget { font-family: 'Segoe UI', 'SF Pro Display', sans-serif; }"
+        assert _minify(qss) == "QWidget{font-family:'Segoe UI','SF Pro Display',sans-serif;}"
+    
+    def test_comment_between_rules(self):
+        """Test a comment between rules leaves no stray whitespace."""
+        assert _minify("A { x: 1; }\n\n/* B */\nB { y: 2; }") == "A{x:1;}B{y:2;}"
+
+
+class TestLoadStylesheet:
+    """Test loading the bundled stylesheet."""
+    
+    def test_relative_urls_resolve_under_resources(self):
+        """Test bare url() references point into RESOURCES_DIR."""
+        qss = load_stylesheet()
+        expected = f'url("{(RESOURCES_DIR / "check.png").as_posix()}")'
+        
+        assert expected in qss
+        assert "url(check.png)" not in qss
+    
+    def test_referenced_images_exist(self):
+        """Test every image the stylesheet references is shipped."""
+        assert (RESOURCES_DIR / "check.png").exists()
+        assert (RESOURCES_DIR / "check@2x.png").exists()
+    
+    def test_is_minified(self):
+        """Test the loaded stylesheet carries no comments or newlines."""
+        qss = load_stylesheet()
+        
+        assert "/*" not in qss
+        assert "\n" not in qss
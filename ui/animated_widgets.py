@@ -1,81 +1,151 @@
 """Custom animated widgets for modern UI."""
 
-from PySide6.QtWidgets import QPushButton, QLabel, QFrame, QProgressBar, QWidget, QVBoxLayout
-from PySide6.QtCore import QPropertyAnimation, QEasingCurve, QTimer, pyqtSignal, Qt, QRect
-from PySide6.QtGui import QPixmap, QPainter, QLinearGradient, QColor, QPen, QBrush
+import math
+
+import numpy as np
+from PySide6.QtWidgets import (
+    QPushButton, QLabel, QFrame, QProgressBar, QWidget, QVBoxLayout, QGraphicsOpacityEffect,
+    QStyle, QStyleOptionButton, QStylePainter, QGraphicsDropShadowEffect
+)
+from PySide6.QtCore import (
+    QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QTimer, Signal, Qt,
+    QRectF, QPointF, Property, QObject
+)
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QLinearGradient, QColor, QPen, QBrush
+
+
+def _wave_kernel(wave, rand_base, out):
+    """
+    Combine wave offsets and random base heights into clipped bar heights.
+    
+    Works in place on ``out`` and accepts stacked 2-D arrays, so several
+    visualizers can be updated with one call.
+    """
+    np.add(rand_base, wave, out=out)
+    out += 20.0
+    np.clip(out, 10, 80, out=out)
+    return out
+
+
+class AnimationClock(QObject):
+    """Shared animation clock that drives all animated widgets from one timer."""
+    
+    tick = Signal(int)  # Frame index
+    
+    INTERVAL_MS = 50  # 20 Hz
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Get the process-wide animation clock."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        self._frame = 0
+        self._subscribers = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._emit)
+    
+    def subscribe(self, slot):
+        """Connect a slot to the tick signal, starting the timer if needed."""
+        self.tick.connect(slot)
+        self._subscribers += 1
+        if not self._timer.isActive():
+            self._timer.start(self.INTERVAL_MS)
+    
+    def unsubscribe(self, slot):
+        """Disconnect a slot, stopping the timer once nobody is listening."""
+        self.tick.disconnect(slot)
+        self._subscribers = max(0, self._subscribers - 1)
+        if self._subscribers == 0:
+            self._timer.stop()
+    
+    def _emit(self):
+        self._frame += 1
+        self.tick.emit(self._frame)
 
 
 class AnimatedButton(QPushButton):
     """Button with hover and click animations."""
     
+    # The scale is applied at paint time and the button rests at its natural
+    # size; the hover growth is kept small since painting is clipped to the
+    # widget rect
+    REST_SCALE = 1.0
+    HOVER_SCALE = 1.02
+    PRESSED_SCALE = 0.97
+    
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
+        self._scale = self.REST_SCALE
         self.setMouseTracking(True)
         self.setup_animations()
     
     def setup_animations(self):
         """Set up button animations."""
         # Hover animation
-        self.hover_animation = QPropertyAnimation(self, b"geometry")
+        self.hover_animation = QPropertyAnimation(self, b"scale")
         self.hover_animation.setDuration(200)
         self.hover_animation.setEasingCurve(QEasingCurve.OutCubic)
         
         # Click animation
-        self.click_animation = QPropertyAnimation(self, b"geometry")
+        self.click_animation = QPropertyAnimation(self, b"scale")
         self.click_animation.setDuration(100)
         self.click_animation.setEasingCurve(QEasingCurve.InOutCubic)
+    
+    def _get_scale(self):
+        return self._scale
+    
+    def _set_scale(self, value):
+        self._scale = value
+        self.update()
+    
+    scale = Property(float, _get_scale, _set_scale)
+    
+    def _animate_to(self, animation, value):
+        """Animate the paint scale from its current value to ``value``."""
+        self.hover_animation.stop()
+        self.click_animation.stop()
+        animation.setStartValue(self._scale)
+        animation.setEndValue(value)
+        animation.start()
+    
+    def paintEvent(self, event):
+        """Paint the button scaled around its center."""
+        painter = QStylePainter(self)
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
         
-        self.original_geometry = None
+        center = QRectF(self.rect()).center()
+        painter.translate(center)
+        painter.scale(self._scale, self._scale)
+        painter.translate(-center)
+        painter.drawControl(QStyle.CE_PushButton, option)
     
     def enterEvent(self, event):
         """Handle mouse enter for hover effect."""
         super().enterEvent(event)
-        if self.original_geometry is None:
-            self.original_geometry = self.geometry()
-        
-        # Slight scale up on hover
-        new_geometry = QRect(
-            self.original_geometry.x() - 2,
-            self.original_geometry.y() - 2,
-            self.original_geometry.width() + 4,
-            self.original_geometry.height() + 4
-        )
-        
-        self.hover_animation.setStartValue(self.geometry())
-        self.hover_animation.setEndValue(new_geometry)
-        self.hover_animation.start()
+        self._animate_to(self.hover_animation, self.HOVER_SCALE)
     
     def leaveEvent(self, event):
         """Handle mouse leave to revert hover effect."""
         super().leaveEvent(event)
-        if self.original_geometry:
-            self.hover_animation.setStartValue(self.geometry())
-            self.hover_animation.setEndValue(self.original_geometry)
-            self.hover_animation.start()
+        self._animate_to(self.hover_animation, self.REST_SCALE)
     
     def mousePressEvent(self, event):
         """Handle mouse press for click animation."""
         super().mousePressEvent(event)
-        if self.original_geometry:
-            # Scale down slightly on click
-            pressed_geometry = QRect(
-                self.original_geometry.x() + 1,
-                self.original_geometry.y() + 1,
-                self.original_geometry.width() - 2,
-                self.original_geometry.height() - 2
-            )
-            
-            self.click_animation.setStartValue(self.geometry())
-            self.click_animation.setEndValue(pressed_geometry)
-            self.click_animation.start()
+        self._animate_to(self.click_animation, self.PRESSED_SCALE)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release to restore size."""
         super().mouseReleaseEvent(event)
-        if self.original_geometry:
-            self.click_animation.setStartValue(self.geometry())
-            self.click_animation.setEndValue(self.original_geometry)
-            self.click_animation.start()
+        target = self.HOVER_SCALE if self.underMouse() else self.REST_SCALE
+        self._animate_to(self.click_animation, target)
 
 
 class PulsingLabel(QLabel):
@@ -87,15 +157,18 @@ class PulsingLabel(QLabel):
     
     def setup_pulse_animation(self):
         """Set up pulsing animation."""
-        self.pulse_animation = QPropertyAnimation(self, b"styleSheet")
+        # Animate a numeric opacity instead of the stylesheet so Qt never
+        # has to re-parse CSS while pulsing
+        self.opacity_effect = QGraphicsOpacityEffect(self)
+        self.opacity_effect.setOpacity(1.0)
+        self.setGraphicsEffect(self.opacity_effect)
+        
+        self.pulse_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
         self.pulse_animation.setDuration(2000)
         self.pulse_animation.setLoopCount(-1)  # Infinite loop
-        
-        # Create pulsing effect by changing opacity
-        base_style = self.styleSheet()
-        self.pulse_animation.setKeyValueAt(0, base_style + "color: rgba(255, 255, 255, 1);")
-        self.pulse_animation.setKeyValueAt(0.5, base_style + "color: rgba(255, 255, 255, 0.6);")
-        self.pulse_animation.setKeyValueAt(1, base_style + "color: rgba(255, 255, 255, 1);")
+        self.pulse_animation.setKeyValueAt(0, 1.0)
+        self.pulse_animation.setKeyValueAt(0.5, 0.6)
+        self.pulse_animation.setKeyValueAt(1, 1.0)
     
     def start_pulsing(self):
         """Start the pulsing animation."""
@@ -104,50 +177,76 @@ class PulsingLabel(QLabel):
     def stop_pulsing(self):
         """Stop the pulsing animation."""
         self.pulse_animation.stop()
+        self.opacity_effect.setOpacity(1.0)
 
 
 class GlowingProgressBar(QProgressBar):
     """Progress bar with glowing effect."""
     
+    GLOW_STYLE_TEMPLATE = """
+        QProgressBar {{
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 10px;
+            height: 12px;
+        }}
+        QProgressBar::chunk {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 {0}, stop:0.5 {1}, stop:1 {2});
+            border-radius: 10px;
+        }}
+    """
+    BASE_STOPS = (QColor("#4752c4"), QColor("#5865f2"), QColor("#6574ff"))
+    GLOW_STOPS = (QColor("#6574ff"), QColor("#7584ff"), QColor("#8594ff"))
+    GLOW_LEVELS = 8  # Number of distinct stylesheets per half glow cycle
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._glow_phase = 0.0
+        self._glow_level = -1
+        self._glow_styles = {}
         self.setup_glow_animation()
     
     def setup_glow_animation(self):
         """Set up glowing animation for progress bar."""
-        self.glow_animation = QPropertyAnimation(self, b"styleSheet")
+        self.glow_animation = QPropertyAnimation(self, b"glowPhase")
         self.glow_animation.setDuration(1500)
         self.glow_animation.setLoopCount(-1)
+        self.glow_animation.setKeyValueAt(0, 0.0)
+        self.glow_animation.setKeyValueAt(0.5, 1.0)
+        self.glow_animation.setKeyValueAt(1, 0.0)
         
-        base_style = """
-            QProgressBar {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-                height: 12px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4752c4, stop:0.5 #5865f2, stop:1 #6574ff);
-                border-radius: 10px;
-            }
-        """
+        self._apply_glow_level(0)
+    
+    def _get_glow_phase(self):
+        return self._glow_phase
+    
+    def _set_glow_phase(self, value):
+        self._glow_phase = value
+        # Only touch the stylesheet when the quantized glow level changes
+        level = round(value * self.GLOW_LEVELS)
+        if level != self._glow_level:
+            self._apply_glow_level(level)
+    
+    glowPhase = Property(float, _get_glow_phase, _set_glow_phase)
+    
+    def _apply_glow_level(self, level):
+        """Apply the cached stylesheet for a quantized glow level."""
+        style = self._glow_styles.get(level)
+        if style is None:
+            t = level / self.GLOW_LEVELS
+            stops = []
+            for base, glow in zip(self.BASE_STOPS, self.GLOW_STOPS):
+                color = QColor(
+                    int(base.red() + (glow.red() - base.red()) * t),
+                    int(base.green() + (glow.green() - base.green()) * t),
+                    int(base.blue() + (glow.blue() - base.blue()) * t)
+                )
+                stops.append(color.name())
+            style = self.GLOW_STYLE_TEMPLATE.format(*stops)
+            self._glow_styles[level] = style
         
-        glow_style = """
-            QProgressBar {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-                height: 12px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #6574ff, stop:0.5 #7584ff, stop:1 #8594ff);
-                border-radius: 10px;
-            }
-        """
-        
-        self.glow_animation.setKeyValueAt(0, base_style)
-        self.glow_animation.setKeyValueAt(0.5, glow_style)
-        self.glow_animation.setKeyValueAt(1, base_style)
+        self._glow_level = level
+        self.setStyleSheet(style)
     
     def start_glowing(self):
         """Start the glowing effect."""
@@ -156,6 +255,7 @@ class GlowingProgressBar(QProgressBar):
     def stop_glowing(self):
         """Stop the glowing effect."""
         self.glow_animation.stop()
+        self._apply_glow_level(0)
 
 
 class FloatingCard(QFrame):
@@ -175,46 +275,73 @@ class FloatingCard(QFrame):
     
     def setup_float_animation(self):
         """Set up floating animation."""
-        self.float_animation = QPropertyAnimation(self, b"geometry")
-        self.float_animation.setDuration(3000)
+        # Animate the drop shadow rather than the geometry: shadow changes
+        # are paint-only and never invalidate the parent layout
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._shadow.setBlurRadius(15)
+        self._shadow.setOffset(QPointF(0, 4))
+        self._shadow.setColor(QColor(0, 0, 0, 120))
+        self.setGraphicsEffect(self._shadow)
+        
+        blur_animation = QPropertyAnimation(self._shadow, b"blurRadius")
+        blur_animation.setDuration(3000)
+        blur_animation.setKeyValueAt(0, 15.0)
+        blur_animation.setKeyValueAt(0.5, 25.0)
+        blur_animation.setKeyValueAt(1, 15.0)
+        blur_animation.setEasingCurve(QEasingCurve.InOutSine)
+        
+        offset_animation = QPropertyAnimation(self._shadow, b"yOffset")
+        offset_animation.setDuration(3000)
+        offset_animation.setKeyValueAt(0, 4.0)
+        offset_animation.setKeyValueAt(0.5, 9.0)
+        offset_animation.setKeyValueAt(1, 4.0)
+        offset_animation.setEasingCurve(QEasingCurve.InOutSine)
+        
+        self.float_animation = QParallelAnimationGroup(self)
+        self.float_animation.addAnimation(blur_animation)
+        self.float_animation.addAnimation(offset_animation)
         self.float_animation.setLoopCount(-1)
-        self.float_animation.setEasingCurve(QEasingCurve.InOutSine)
     
     def start_floating(self):
         """Start the floating animation."""
-        if self.geometry().isValid():
-            original_rect = self.geometry()
-            float_rect = QRect(
-                original_rect.x(),
-                original_rect.y() - 5,
-                original_rect.width(),
-                original_rect.height()
-            )
-            
-            self.float_animation.setKeyValueAt(0, original_rect)
-            self.float_animation.setKeyValueAt(0.5, float_rect)
-            self.float_animation.setKeyValueAt(1, original_rect)
-            self.float_animation.start()
+        self.float_animation.start()
     
     def stop_floating(self):
         """Stop the floating animation."""
         self.float_animation.stop()
+        self._shadow.setBlurRadius(15)
+        self._shadow.setOffset(QPointF(0, 4))
 
 
 class WaveformVisualizer(QWidget):
     """Animated waveform visualization widget."""
     
+    BAR_COUNT = 50
+    
+    # Phase advance per frame, rounded so a whole number of frames spans
+    # exactly one period and the table wraps without a jump
+    PHASE_STEP = 0.2
+    SIN_TABLE_FRAMES = round(2 * np.pi / PHASE_STEP)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(300, 100)
-        self.bars = []
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_bars)
-        self.current_frame = 0
+        self._animating = False
+        self._ticking = False
+        self._brush = None
+        self._rng = np.random.default_rng()
         
-        # Generate initial bar heights
-        import random
-        self.bars = [random.randint(10, 80) for _ in range(50)]
+        # Per-bar phase offsets and preallocated bar heights
+        self.phases = np.arange(self.BAR_COUNT, dtype=np.float32) * 0.3
+        self.bars = np.empty(self.BAR_COUNT, dtype=np.float32)
+        self._bar_indices = np.arange(self.BAR_COUNT, dtype=np.float32)
+        self._rects = [QRectF() for _ in range(self.BAR_COUNT)]
+        
+        # Precompute one period of the wave
+        frames = np.linspace(0, 2 * np.pi, self.SIN_TABLE_FRAMES, endpoint=False, dtype=np.float32)
+        self._sin_table = (np.sin(frames[:, None] + self.phases[None, :]) * 30.0).astype(np.float32)
+        self._frame_idx = 0
+        self.bars[:] = self._rng.integers(10, 81, size=self.BAR_COUNT)
         
         self.setStyleSheet("""
             QWidget {
@@ -229,44 +356,83 @@ class WaveformVisualizer(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Create gradient for bars
+        if self._brush is None:
+            self._build_brush()
+        
+        bar_width = self.width() / len(self.bars)
+        inner_width = bar_width - 4
+        xs = (self._bar_indices * bar_width + 2).tolist()
+        ys = (self.height() - self.bars).tolist()
+        heights = self.bars.tolist()
+        
+        # Collect all bars into one path so they are filled in a single call
+        path = QPainterPath()
+        for rect, x, y, height in zip(self._rects, xs, ys, heights):
+            rect.setRect(x, y, inner_width, height)
+            path.addRoundedRect(rect, 2, 2)
+        
+        painter.fillPath(path, self._brush)
+    
+    def resizeEvent(self, event):
+        """Rebuild the bar gradient for the new height."""
+        super().resizeEvent(event)
+        self._build_brush()
+    
+    def _build_brush(self):
+        """Create the gradient brush used for the bars."""
         gradient = QLinearGradient(0, 0, 0, self.height())
         gradient.setColorAt(0, QColor(88, 101, 242, 200))
         gradient.setColorAt(0.5, QColor(101, 116, 255, 255))
         gradient.setColorAt(1, QColor(117, 132, 255, 150))
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.NoPen)
-        
-        bar_width = self.width() / len(self.bars)
-        
-        for i, height in enumerate(self.bars):
-            x = i * bar_width
-            y = self.height() - height
-            rect = QRect(int(x + 2), int(y), int(bar_width - 4), int(height))
-            painter.drawRoundedRect(rect, 2, 2)
+        self._brush = QBrush(gradient)
     
     def update_bars(self):
         """Update bar heights for animation."""
-        import random
-        import math
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
         
         # Create wave-like animation
-        self.current_frame += 0.2
-        for i in range(len(self.bars)):
-            wave = math.sin(self.current_frame + i * 0.3) * 30
-            base_height = 20 + random.randint(0, 20)
-            self.bars[i] = max(10, min(80, base_height + wave))
+        wave = self._sin_table[self._frame_idx]
+        self._frame_idx = (self._frame_idx + 1) % self._sin_table.shape[0]
+        base = self._rng.integers(0, 21, size=self.BAR_COUNT, dtype=np.int16)
+        _wave_kernel(wave, base, self.bars)
         
         self.update()
     
+    def _on_tick(self, frame):
+        self.update_bars()
+    
+    def _set_ticking(self, ticking):
+        """Subscribe to or unsubscribe from the shared animation clock."""
+        if ticking == self._ticking:
+            return
+        self._ticking = ticking
+        if ticking:
+            AnimationClock.instance().subscribe(self._on_tick)
+        else:
+            AnimationClock.instance().unsubscribe(self._on_tick)
+    
+    def showEvent(self, event):
+        """Resume the animation when the widget becomes visible."""
+        super().showEvent(event)
+        if self._animating:
+            self._set_ticking(True)
+    
+    def hideEvent(self, event):
+        """Pause the animation while the widget is hidden."""
+        super().hideEvent(event)
+        self._set_ticking(False)
+    
     def start_animation(self):
         """Start the waveform animation."""
-        self.animation_timer.start(50)  # Update every 50ms
+        self._animating = True
+        if self.isVisible():
+            self._set_ticking(True)
     
     def stop_animation(self):
         """Stop the waveform animation."""
-        self.animation_timer.stop()
+        self._animating = False
+        self._set_ticking(False)
 
 
 class StatusIndicator(QWidget):
@@ -276,39 +442,71 @@ class StatusIndicator(QWidget):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self.status = "idle"  # idle, processing, success, error
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update)
+        self._ticking = False
         self.rotation = 0
+        
+        # The widget has a fixed size, so the spinner brush never changes
+        radius = 8
+        gradient = QLinearGradient(-radius, -radius, radius, radius)
+        gradient.setColorAt(0, QColor(88, 101, 242, 255))
+        gradient.setColorAt(0.5, QColor(88, 101, 242, 100))
+        gradient.setColorAt(1, QColor(88, 101, 242, 50))
+        self._processing_brush = QBrush(gradient)
+        
+        # Pre-rendered pixmaps for the non-animated states, keyed by (status, dpr)
+        self._static_pixmaps = {}
     
     def paintEvent(self, event):
         """Paint the status indicator."""
         painter = QPainter(self)
+        
+        if self.status != "processing":
+            painter.drawPixmap(0, 0, self._static_pixmap(self.status))
+            return
+        
         painter.setRenderHint(QPainter.Antialiasing)
         
         center = self.rect().center()
         radius = 8
         
-        if self.status == "idle":
+        # Spinning gradient circle
+        painter.translate(center)
+        painter.rotate(self.rotation)
+        
+        painter.setBrush(self._processing_brush)
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(-radius, -radius, radius * 2, radius * 2)
+    
+    def _static_pixmap(self, status):
+        """Get the cached pixmap for a static status, rendering it on first use."""
+        dpr = self.devicePixelRatioF()
+        key = (status, dpr)
+        pixmap = self._static_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._render_static(painter, status)
+            painter.end()
+            
+            self._static_pixmaps[key] = pixmap
+        return pixmap
+    
+    def _render_static(self, painter, status):
+        """Draw a non-animated status."""
+        center = self.rect().center()
+        radius = 8
+        
+        if status == "idle":
             # Gray circle
             painter.setBrush(QBrush(QColor(160, 168, 183, 100)))
             painter.setPen(QPen(QColor(160, 168, 183), 2))
             painter.drawEllipse(center, radius, radius)
         
-        elif self.status == "processing":
-            # Spinning gradient circle
-            painter.translate(center)
-            painter.rotate(self.rotation)
-            
-            gradient = QLinearGradient(-radius, -radius, radius, radius)
-            gradient.setColorAt(0, QColor(88, 101, 242, 255))
-            gradient.setColorAt(0.5, QColor(88, 101, 242, 100))
-            gradient.setColorAt(1, QColor(88, 101, 242, 50))
-            
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(-radius, -radius, radius * 2, radius * 2)
-        
-        elif self.status == "success":
+        elif status == "success":
             # Green checkmark
             painter.setBrush(QBrush(QColor(87, 242, 135, 200)))
             painter.setPen(QPen(QColor(87, 242, 135), 2))
@@ -319,7 +517,7 @@ class StatusIndicator(QWidget):
             painter.drawLine(center.x() - 3, center.y(), center.x() - 1, center.y() + 2)
             painter.drawLine(center.x() - 1, center.y() + 2, center.x() + 3, center.y() - 2)
         
-        elif self.status == "error":
+        elif status == "error":
             # Red X
             painter.setBrush(QBrush(QColor(237, 66, 69, 200)))
             painter.setPen(QPen(QColor(237, 66, 69), 2))
@@ -335,27 +533,52 @@ class StatusIndicator(QWidget):
         self.status = status
         
         if status == "processing":
-            self.animation_timer.start(50)
+            self._set_ticking(self.isVisible())
         else:
-            self.animation_timer.stop()
+            self._set_ticking(False)
             self.rotation = 0
         
         self.update()
     
     def update_rotation(self):
         """Update rotation for processing animation."""
+        if not self.isVisible():
+            return
         self.rotation = (self.rotation + 10) % 360
         self.update()
     
+    def _on_tick(self, frame):
+        self.update_rotation()
+    
+    def _set_ticking(self, ticking):
+        """Subscribe to or unsubscribe from the shared animation clock."""
+        if ticking == self._ticking:
+            return
+        self._ticking = ticking
+        if ticking:
+            AnimationClock.instance().subscribe(self._on_tick)
+        else:
+            AnimationClock.instance().unsubscribe(self._on_tick)
+    
+    def showEvent(self, event):
+        """Resume the animation when the widget becomes visible."""
+        super().showEvent(event)
+        if self.status == "processing":
+            self._set_ticking(True)
+    
+    def hideEvent(self, event):
+        """Pause the animation while the widget is hidden."""
+        super().hideEvent(event)
+        self._set_ticking(False)
+    
     def start_animation(self):
         """Start the animation."""
         if self.status == "processing":
-            self.animation_timer.timeout.connect(self.update_rotation)
-            self.animation_timer.start(50)
+            self._set_ticking(self.isVisible())
     
     def stop_animation(self):
         """Stop the animation."""
-        self.animation_timer.stop()
+        self._set_ticking(False)
 
 
 class LoadingSpinner(QWidget):
@@ -364,9 +587,22 @@ class LoadingSpinner(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(50, 50)
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_rotation)
-        self.rotation = 0
+        self.rotation = 0  # Index of the brightest dot, 0..7
+        self._spinning = False
+        self._ticking = False
+        
+        # Fading dot brushes, from faintest to brightest
+        self._dot_brushes = [
+            QBrush(QColor(88, 101, 242, int(255 * (i + 1) / 8))) for i in range(8)
+        ]
+        
+        # Dot rectangles around the ring, relative to the spinner center
+        self._dot_rects = []
+        for i in range(8):
+            angle = math.radians(i * 45)
+            x = 18 * math.cos(angle)
+            y = 18 * math.sin(angle)
+            self._dot_rects.append(QRectF(x - 3, y - 3, 6, 6))
         
     def paintEvent(self, event):
         """Paint the loading spinner."""
@@ -375,32 +611,55 @@ class LoadingSpinner(QWidget):
         
         center = self.rect().center()
         painter.translate(center)
-        painter.rotate(self.rotation)
         
-        # Draw multiple circles in a circle
-        for i in range(8):
-            angle = i * 45
-            painter.save()
-            painter.rotate(angle)
-            
+        # The ring is rotationally symmetric, so "rotating" it only means
+        # shifting which dot gets which brightness
+        painter.setPen(Qt.NoPen)
+        for i, rect in enumerate(self._dot_rects):
             # Fade effect
-            alpha = int(255 * (i + 1) / 8)
-            color = QColor(88, 101, 242, alpha)
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            
-            painter.drawEllipse(15, -3, 6, 6)
-            painter.restore()
+            painter.setBrush(self._dot_brushes[(i - self.rotation) % 8])
+            painter.drawEllipse(rect)
     
     def update_rotation(self):
-        """Update rotation angle."""
-        self.rotation = (self.rotation + 45) % 360
+        """Advance the brightest dot by one position."""
+        if not self.isVisible():
+            return
+        self.rotation = (self.rotation + 1) % 8
         self.update()
     
+    def _on_tick(self, frame):
+        # Rotate every 4th clock tick (200ms)
+        if frame % 4 == 0:
+            self.update_rotation()
+    
+    def _set_ticking(self, ticking):
+        """Subscribe to or unsubscribe from the shared animation clock."""
+        if ticking == self._ticking:
+            return
+        self._ticking = ticking
+        if ticking:
+            AnimationClock.instance().subscribe(self._on_tick)
+        else:
+            AnimationClock.instance().unsubscribe(self._on_tick)
+    
+    def showEvent(self, event):
+        """Resume spinning when the widget becomes visible."""
+        super().showEvent(event)
+        if self._spinning:
+            self._set_ticking(True)
+    
+    def hideEvent(self, event):
+        """Pause spinning while the widget is hidden."""
+        super().hideEvent(event)
+        self._set_ticking(False)
+    
     def start_spinning(self):
         """Start the spinning animation."""
-        self.animation_timer.start(200)  # Rotate every 200ms
+        self._spinning = True
+        if self.isVisible():
+            self._set_ticking(True)
     
     def stop_spinning(self):
         """Stop the spinning animation."""
-        self.animation_timer.stop()
\ No newline at end of file
+        self._spinning = False
+        self._set_ticking(False)
\ No newline at end of file
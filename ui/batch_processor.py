@@ -1,19 +1,20 @@
 """Batch processing widget with threading support."""
 
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, Future
-from threading import Lock
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QProgressBar,
-    QLabel, QGroupBox, QSpinBox, QCheckBox, QTextEdit, QFrame
+    QLabel, QGroupBox, QSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QThread, QObject, QMutex, QMutexLocker
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, Signal, QTimer, QThread, QObject, QMutex, QMutexLocker, QWaitCondition
 
 from utils.logging_setup import get_logger
+from utils.paths import generate_output_path
 from core.pipeline import ProcessingPipeline, ProcessingJob, Engine, ProcessingStage
 
 logger = get_logger("batch_processor")
@@ -28,15 +29,32 @@ class BatchWorker(QObject):
     job_completed = Signal(object)  # ProcessingJob
     batch_finished = Signal()
     
+    # Minimum interval between progress signals for the same job
+    PROGRESS_EMIT_INTERVAL = 0.05
+    
     def __init__(self):
         super().__init__()
-        self.pipeline = ProcessingPipeline()
         self.jobs: List[ProcessingJob] = []
         self.current_job_index = 0
+        self.max_workers = 1
         self.is_running = False
         self.is_paused = False
         self.should_stop = False
         self.mutex = QMutex()
+        self._pause_cond = QWaitCondition()
+        
+        # Job pool; each pool thread owns its own pipeline so no pipeline
+        # state is ever shared between concurrently running jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._local = threading.local()
+        
+        # Pipelines currently inside process_job; only these get cancelled
+        self._running_pipelines = set()
+        self._pipelines_lock = threading.Lock()
+        
+        # Per-job (timestamp, percent) of the last emitted progress signal
+        self._emit_state: Dict[int, Tuple[float, int]] = {}
     
     def process_all_jobs(self) -> None:
         """Process all jobs - this runs in the worker thread."""
@@ -44,45 +62,118 @@ class BatchWorker(QObject):
         self.should_stop = False
         self.current_job_index = 0
         
-        while self.current_job_index < len(self.jobs) and not self.should_stop:
-            if self.is_paused:
-                # Sleep briefly and check again
-                import time
-                time.sleep(0.1)
-                continue
-            
-            current_job = self.jobs[self.current_job_index]
-            
-            # Emit job started signal
-            self.job_started.emit(current_job)
-            
-            def progress_callback(job: ProcessingJob) -> None:
-                self.job_progress.emit(job)
-            
-            try:
-                # Process the job (this is the heavy work)
-                success = self.pipeline.process_job(current_job, progress_callback)
-                
-            except Exception as e:
-                current_job.error_message = str(e)
-                current_job.stage = ProcessingStage.ERROR
+        # Snapshot the job list; set_jobs() during a batch applies to the next one
+        jobs = self.jobs
+        executor = self._get_executor()
+        pending = set()
+        
+        while not self.should_stop:
+            # Keep every pool thread busy unless paused
+            if not self.is_paused:
+                while (len(pending) < self.max_workers and
+                       self.current_job_index < len(jobs)):
+                    current_job = jobs[self.current_job_index]
+                    self.current_job_index += 1
+                    
+                    # Emit job started signal
+                    self.job_started.emit(current_job)
+                    pending.add(executor.submit(self._run_job, current_job))
             
-            # Emit job completed signal
-            self.job_completed.emit(current_job)
+            if not pending:
+                if self.is_paused:
+                    self._wait_while_paused()
+                    continue
+                break
             
-            # Move to next job
-            self.current_job_index += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # Emit job completed signal
+                self.job_completed.emit(future.result())
+        
+        # Let jobs that were running when processing stopped wind down
+        for future in as_completed(pending):
+            self.job_completed.emit(future.result())
         
         # All jobs finished or stopped
         self.is_running = False
         self.batch_finished.emit()
+    
+    def _run_job(self, job: ProcessingJob) -> ProcessingJob:
+        """Process a single job - this runs on a pool thread."""
+        if self.should_stop:
+            job.stage = ProcessingStage.CANCELLED
+            job.message = "Processing cancelled"
+            return job
+        
+        pipeline = self._thread_pipeline()
+        with self._pipelines_lock:
+            self._running_pipelines.add(pipeline)
+        
+        try:
+            # Process the job (this is the heavy work)
+            pipeline.process_job(job, self._emit_progress)
+            
+        except Exception as e:
+            job.error_message = str(e)
+            job.stage = ProcessingStage.ERROR
         
+        finally:
+            with self._pipelines_lock:
+                self._running_pipelines.discard(pipeline)
+        
+        self._emit_state.pop(id(job), None)
+        return job
+    
+    def _emit_progress(self, job: ProcessingJob) -> None:
+        """
+        Pipeline progress callback.
+        
+        Intermediate updates are dropped so the UI thread is not flooded
+        with queued cross-thread signals.
+        """
+        now = time.monotonic()
+        pct = int(job.progress * 100)
+        last_ts, last_pct = self._emit_state.get(id(job), (0.0, -1))
+        if (job.is_complete or pct != last_pct or
+                now - last_ts >= self.PROGRESS_EMIT_INTERVAL):
+            self._emit_state[id(job)] = (now, pct)
+            self.job_progress.emit(job)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the job pool, recreating it if the worker count changed."""
+        if self._executor is None or self._executor_workers != self.max_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="batch-job"
+            )
+            self._executor_workers = self.max_workers
+        return self._executor
+    
+    def _thread_pipeline(self) -> ProcessingPipeline:
+        """Get the pipeline owned by the calling pool thread."""
+        pipeline = getattr(self._local, 'pipeline', None)
+        if pipeline is None:
+            pipeline = ProcessingPipeline()
+            self._local.pipeline = pipeline
+        return pipeline
+    
+    def _wait_while_paused(self) -> None:
+        """Block the worker thread until processing is resumed or stopped."""
+        locker = QMutexLocker(self.mutex)
+        while self.is_paused and not self.should_stop:
+            self._pause_cond.wait(self.mutex)
+    
     def set_jobs(self, jobs: List[ProcessingJob]) -> None:
         """Set jobs to process."""
-        locker = QMutexLocker(self.mutex)
-        self.jobs = jobs
+        # A plain attribute rebind is atomic; the worker loop reads a snapshot
+        self.jobs = list(jobs)
         self.current_job_index = 0
     
+    def set_max_workers(self, max_workers: int) -> None:
+        """Set how many jobs may run at the same time."""
+        self.max_workers = max(1, max_workers)
+    
     def start_processing(self) -> None:
         """Start batch processing."""
         self.is_running = True
@@ -94,21 +185,34 @@ class BatchWorker(QObject):
     
     def pause_processing(self) -> None:
         """Pause batch processing."""
+        locker = QMutexLocker(self.mutex)
         self.is_paused = True
     
     def resume_processing(self) -> None:
         """Resume batch processing."""
+        locker = QMutexLocker(self.mutex)
         self.is_paused = False
+        self._pause_cond.wakeAll()
     
     def stop_processing(self) -> None:
         """Stop batch processing."""
-        self.should_stop = True
-        self.is_running = False
-        self.is_paused = False
-        
-        # Cancel current job if running
-        if hasattr(self.pipeline, 'cancel_current_job'):
-            self.pipeline.cancel_current_job()
+        with QMutexLocker(self.mutex):
+            self.should_stop = True
+            self.is_running = False
+            self.is_paused = False
+            self._pause_cond.wakeAll()
+        
+        # Cancel running jobs; idle pipelines still hold their last finished job
+        with self._pipelines_lock:
+            pipelines = list(self._running_pipelines)
+        for pipeline in pipelines:
+            pipeline.cancel_current_job()
+    
+    def shutdown(self) -> None:
+        """Release the job pool threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 
 class BatchProcessorWidget(QWidget):
@@ -120,6 +224,78 @@ class BatchProcessorWidget(QWidget):
     progress_updated = Signal(int, int, str)  # current, total, message
     start_worker_signal = Signal()  # Signal to start worker processing
     
+    # Statistics text templates
+    STATS_TMPL = (
+        "⚡ Processing: {p}/{t} files ({pct:.1f}%)\n"
+        "✅ Success: {s} | ❌ Failed: {f} | 📈 Rate: {r:.1f}%"
+    )
+    TIME_TMPL = "🕰️ Elapsed: {elapsed} | ETA: {eta}"
+    FILE_TMPL = "📈 Avg per file: {avg:.1f}s | Remaining: {remaining} files"
+    
+    STYLE_SHEET = """
+        QLabel#batchHeaderLabel {
+            font-weight: bold;
+            font-size: 11px;
+            color: #a0a8b7;
+        }
+        QLabel#batchStatusLabel {
+            color: #57f287;
+            font-size: 10px;
+        }
+        QLabel#batchEtaLabel {
+            color: #a0a8b7;
+            font-size: 9px;
+        }
+        QLabel#parallelLabel,
+        QCheckBox#continueOnErrorCheck,
+        QCheckBox#autoClearCheck {
+            font-size: 10px;
+        }
+        QSpinBox#parallelJobsSpin {
+            background: rgba(30, 35, 50, 0.9);
+            border: 1px solid rgba(88, 101, 242, 0.4);
+            border-radius: 4px;
+            padding: 2px 4px;
+            padding-right: 18px;
+            font-size: 11px;
+            font-weight: 600;
+        }
+        QPushButton#batchStartButton {
+            background-color: #57f287;
+            color: black;
+            font-weight: bold;
+            font-size: 10px;
+            border-radius: 4px;
+            padding: 2px 6px;
+        }
+        QPushButton#batchPauseButton {
+            font-size: 10px;
+            padding: 2px 6px;
+        }
+        QPushButton#batchStopButton {
+            background-color: #ed4245;
+            color: white;
+            font-weight: bold;
+            font-size: 10px;
+            border-radius: 4px;
+            padding: 2px 6px;
+        }
+        QLabel#batchStatsLabel {
+            color: #e4e7eb;
+            font-size: 11px;
+            padding: 4px;
+            background: rgba(88, 101, 242, 0.05);
+            border-radius: 4px;
+            margin: 2px 0;
+        }
+        QLabel#timeStatsLabel,
+        QLabel#fileStatsLabel {
+            color: #a0a8b7;
+            font-size: 10px;
+            padding: 2px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         
@@ -127,6 +303,15 @@ class BatchProcessorWidget(QWidget):
         self.completed_jobs = 0
         self.failed_jobs = 0
         self.processing_start_time: Optional[float] = None
+        self._file_list_ref: Optional[weakref.ref] = None
+        self._label_texts: Dict[QLabel, str] = {}  # Last text set per stats label
+        
+        # File list status updates from progress signals, flushed together
+        self._pending_status: Dict[Path, ProcessingJob] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_file_status)
         
         # Initialize with default settings
         self.current_settings = {
@@ -144,16 +329,20 @@ class BatchProcessorWidget(QWidget):
         self.worker.moveToThread(self.worker_thread)
         self.worker_thread.start()
         
-        # Connect worker to trigger processing in thread
-        self.start_worker_signal.connect(self.worker.process_all_jobs)
+        # Connect worker to trigger processing in thread; queued explicitly so
+        # the batch always runs on the worker thread, never the caller's
+        self.start_worker_signal.connect(self.worker.process_all_jobs, Qt.QueuedConnection)
         
         self._setup_ui()
         self._connect_signals()
         
-        # Update timer
+        # Elapsed/ETA timer, only running while a batch is active; job
+        # signals refresh the rest of the display directly
         self.update_timer = QTimer()
+        self.update_timer.setInterval(1000)
         self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(500)  # Update every 500ms
+        self.processing_started.connect(self.update_timer.start)
+        self.processing_finished.connect(self.update_timer.stop)
         
         logger.debug("Batch processor widget initialized")
     
@@ -166,7 +355,7 @@ class BatchProcessorWidget(QWidget):
         # Header
         header_layout = QHBoxLayout()
         header_label = QLabel("⚙️ Batch Control")
-        header_label.setStyleSheet("font-weight: bold; font-size: 11px; color: #a0a8b7;")
+        header_label.setObjectName("batchHeaderLabel")
         header_layout.addWidget(header_label)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -192,11 +381,11 @@ class BatchProcessorWidget(QWidget):
         
         # Status labels - compact
         self.status_label = QLabel("🔄 Ready")
-        self.status_label.setStyleSheet("color: #57f287; font-size: 10px;")
+        self.status_label.setObjectName("batchStatusLabel")
         progress_layout.addWidget(self.status_label)
         
         self.eta_label = QLabel("")
-        self.eta_label.setStyleSheet("color: #a0a8b7; font-size: 9px;")
+        self.eta_label.setObjectName("batchEtaLabel")
         progress_layout.addWidget(self.eta_label)
         
         layout.addWidget(progress_group)
@@ -212,7 +401,7 @@ class BatchProcessorWidget(QWidget):
         parallel_layout = QHBoxLayout()
         parallel_layout.setSpacing(4)
         parallel_label = QLabel("Parallel:")
-        parallel_label.setStyleSheet("font-size: 10px;")
+        parallel_label.setObjectName("parallelLabel")
         parallel_layout.addWidget(parallel_label)
         self.parallel_jobs_spin = QSpinBox()
         self.parallel_jobs_spin.setRange(1, 4)
@@ -220,17 +409,7 @@ class BatchProcessorWidget(QWidget):
         self.parallel_jobs_spin.setMaximumHeight(22)
         self.parallel_jobs_spin.setMaximumWidth(55)
         self.parallel_jobs_spin.setToolTip("Number of files to process simultaneously")
-        self.parallel_jobs_spin.setStyleSheet("""
-            QSpinBox {
-                background: rgba(30, 35, 50, 0.9);
-                border: 1px solid rgba(88, 101, 242, 0.4);
-                border-radius: 4px;
-                padding: 2px 4px;
-                padding-right: 18px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-        """)
+        self.parallel_jobs_spin.setObjectName("parallelJobsSpin")
         parallel_layout.addWidget(self.parallel_jobs_spin)
         parallel_layout.addStretch()
         settings_layout.addLayout(parallel_layout)
@@ -238,12 +417,12 @@ class BatchProcessorWidget(QWidget):
         # Continue on error - compact
         self.continue_on_error = QCheckBox("Continue on error")
         self.continue_on_error.setChecked(True)
-        self.continue_on_error.setStyleSheet("font-size: 10px;")
+        self.continue_on_error.setObjectName("continueOnErrorCheck")
         settings_layout.addWidget(self.continue_on_error)
         
         # Auto-clear completed - compact
         self.auto_clear_completed = QCheckBox("Auto-clear completed")
-        self.auto_clear_completed.setStyleSheet("font-size: 10px;")
+        self.auto_clear_completed.setObjectName("autoClearCheck")
         settings_layout.addWidget(self.auto_clear_completed)
         
         layout.addWidget(settings_group)
@@ -254,39 +433,21 @@ class BatchProcessorWidget(QWidget):
         
         self.start_button = QPushButton("▶ Start")
         self.start_button.setFixedHeight(24)
-        self.start_button.setStyleSheet("""
-            QPushButton { 
-                background-color: #57f287; 
-                color: black; 
-                font-weight: bold; 
-                font-size: 10px;
-                border-radius: 4px;
-                padding: 2px 6px;
-            }
-        """)
+        self.start_button.setObjectName("batchStartButton")
         self.start_button.clicked.connect(self.start_processing)
         button_layout.addWidget(self.start_button)
         
         self.pause_button = QPushButton("⏸ Pause")
         self.pause_button.setEnabled(False)
         self.pause_button.setFixedHeight(24)
-        self.pause_button.setStyleSheet("font-size: 10px; padding: 2px 6px;")
+        self.pause_button.setObjectName("batchPauseButton")
         self.pause_button.clicked.connect(self.pause_processing)
         button_layout.addWidget(self.pause_button)
         
         self.stop_button = QPushButton("⏹ Stop")
         self.stop_button.setEnabled(False)
         self.stop_button.setFixedHeight(24)
-        self.stop_button.setStyleSheet("""
-            QPushButton { 
-                background-color: #ed4245; 
-                color: white; 
-                font-weight: bold; 
-                font-size: 10px;
-                border-radius: 4px;
-                padding: 2px 6px;
-            }
-        """)
+        self.stop_button.setObjectName("batchStopButton")
         self.stop_button.clicked.connect(self.stop_processing)
         button_layout.addWidget(self.stop_button)
         
@@ -301,51 +462,37 @@ class BatchProcessorWidget(QWidget):
         stats_layout.setSpacing(4)
         
         self.stats_label = QLabel("📋 Ready - No processing activity")
-        self.stats_label.setStyleSheet("""
-            QLabel {
-                color: #e4e7eb;
-                font-size: 11px;
-                padding: 4px;
-                background: rgba(88, 101, 242, 0.05);
-                border-radius: 4px;
-                margin: 2px 0;
-            }
-        """)
+        self.stats_label.setObjectName("batchStatsLabel")
         self.stats_label.setWordWrap(True)
         stats_layout.addWidget(self.stats_label)
         
         # Add detailed stats labels
         self.time_stats_label = QLabel("")
-        self.time_stats_label.setStyleSheet("""
-            QLabel {
-                color: #a0a8b7;
-                font-size: 10px;
-                padding: 2px;
-            }
-        """)
+        self.time_stats_label.setObjectName("timeStatsLabel")
         stats_layout.addWidget(self.time_stats_label)
         
         self.file_stats_label = QLabel("")
-        self.file_stats_label.setStyleSheet("""
-            QLabel {
-                color: #a0a8b7;
-                font-size: 10px;
-                padding: 2px;
-            }
-        """)
+        self.file_stats_label.setObjectName("fileStatsLabel")
         stats_layout.addWidget(self.file_stats_label)
         
         layout.addWidget(stats_group)
         
         # Remove stretch to make content visible
         # layout.addStretch()
+        
+        # Style all children with one stylesheet, parsed once
+        self.setStyleSheet(self.STYLE_SHEET)
     
     def _connect_signals(self) -> None:
-        """Connect signals from worker."""
-        self.worker.job_started.connect(self._on_job_started)
-        self.worker.job_progress.connect(self._on_job_progress)
-        self.worker.job_completed.connect(self._on_job_completed)
-        self.worker.batch_finished.connect(self._on_batch_finished)
+        """Connect signals from worker.
+        
+        All worker signals cross threads, so they are queued explicitly; the
+        worker must only reach widget state through these slots.
+        """
+        self.worker.job_started.connect(self._on_job_started, Qt.QueuedConnection)
+        self.worker.job_progress.connect(self._on_job_progress, Qt.QueuedConnection)
+        self.worker.job_completed.connect(self._on_job_completed, Qt.QueuedConnection)
+        self.worker.batch_finished.connect(self._on_batch_finished, Qt.QueuedConnection)
     
     def update_settings(self, settings: Dict[str, Any]) -> None:
         """Update batch processing settings."""
@@ -355,33 +502,38 @@ class BatchProcessorWidget(QWidget):
     
     def set_files(self, file_paths: List[Path]) -> None:
         """Set files to be processed."""
-        self.jobs.clear()
+        # Read settings once for the whole batch
+        settings = self.current_settings
+        engine = Engine(settings.get('engine', 'spectral_gate'))
+        engine_config = settings.get('engine_config', {})
+        output_format = settings.get('output_format', 'wav')
+        output_dir = settings.get('output_directory')
+        output_directory = Path(output_dir) if output_dir else None
+        sample_rate = settings.get('output_sample_rate')
+        preserve_video = settings.get('preserve_video', True)
+        normalize_loudness = settings.get('normalize_loudness', False)
+        target_lufs = settings.get('target_lufs', -23.0)
         
         # Create jobs from file paths
-        from utils.paths import generate_output_path
-        
-        for file_path in file_paths:
-            # Generate output path with custom directory if specified
-            output_dir = self.current_settings.get('output_directory')
-            output_path = generate_output_path(
-                file_path,
-                suffix="_clean",
-                output_format=f".{self.current_settings.get('output_format', 'wav')}",
-                output_directory=Path(output_dir) if output_dir else None
-            )
-            
-            job = ProcessingJob(
+        self.jobs = [
+            ProcessingJob(
                 input_path=file_path,
-                output_path=output_path,
-                engine=Engine(self.current_settings.get('engine', 'spectral_gate')),
-                engine_config=self.current_settings.get('engine_config', {}),
-                output_format=self.current_settings.get('output_format', 'wav'),
-                sample_rate=self.current_settings.get('output_sample_rate'),
-                preserve_video=self.current_settings.get('preserve_video', True),
-                normalize_loudness=self.current_settings.get('normalize_loudness', False),
-                target_lufs=self.current_settings.get('target_lufs', -23.0)
+                output_path=generate_output_path(
+                    file_path,
+                    suffix="_clean",
+                    output_format=f".{output_format}",
+                    output_directory=output_directory
+                ),
+                engine=engine,
+                engine_config=engine_config,
+                output_format=output_format,
+                sample_rate=sample_rate,
+                preserve_video=preserve_video,
+                normalize_loudness=normalize_loudness,
+                target_lufs=target_lufs
             )
-            self.jobs.append(job)
+            for file_path in file_paths
+        ]
         
         logger.info(f"Set {len(self.jobs)} jobs for batch processing")
     
@@ -407,7 +559,7 @@ class BatchProcessorWidget(QWidget):
         # Reset counters
         self.completed_jobs = 0
         self.failed_jobs = 0
-        self.processing_start_time = time.time()
+        self.processing_start_time = time.monotonic()
         
         # Update UI
         self.start_button.setEnabled(False)
@@ -421,6 +573,7 @@ class BatchProcessorWidget(QWidget):
         
         # Set jobs in worker and start processing in thread
         self.worker.set_jobs(self.jobs)
+        self.worker.set_max_workers(self.parallel_jobs_spin.value())
         
         # Emit signal to start processing in worker thread
         self.start_worker_signal.emit()
@@ -473,11 +626,12 @@ class BatchProcessorWidget(QWidget):
         """Handle job started signal."""
         self.status_label.setText(f"Processing: {job.input_path.name}")
         self.job_progress.setValue(0)
+        self._update_display()
         
         # Update file list status
-        main_window = self.window()
-        if hasattr(main_window, 'file_list'):
-            main_window.file_list.update_file_status(job.input_path, job)
+        file_list = self._get_file_list()
+        if file_list is not None:
+            file_list.update_file_status(job.input_path, job)
         
         logger.debug(f"Job started: {job.input_path}")
     
@@ -485,10 +639,10 @@ class BatchProcessorWidget(QWidget):
         """Handle job progress signal."""
         self.job_progress.setValue(int(job.progress * 100))
         
-        # Update file list status
-        main_window = self.window()
-        if hasattr(main_window, 'file_list'):
-            main_window.file_list.update_file_status(job.input_path, job)
+        # Queue file list status update
+        self._pending_status[job.input_path] = job
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
         
         # Emit progress signal
         current = self.completed_jobs
@@ -498,18 +652,19 @@ class BatchProcessorWidget(QWidget):
     
     def _on_job_completed(self, job: ProcessingJob) -> None:
         """Handle job completed signal."""
-        if job.is_complete and job.stage.name == 'COMPLETE':
+        if job.is_complete and job.stage is ProcessingStage.COMPLETE:
             self.completed_jobs += 1
         else:
             self.failed_jobs += 1
         
         # Update overall progress
         self.overall_progress.setValue(self.completed_jobs + self.failed_jobs)
+        self._update_display()
         
         # Update file list status
-        main_window = self.window()
-        if hasattr(main_window, 'file_list'):
-            main_window.file_list.update_file_status(job.input_path, job)
+        file_list = self._get_file_list()
+        if file_list is not None:
+            file_list.update_file_status(job.input_path, job)
         
         logger.info(f"Job completed: {job.input_path} -> {job.stage.name}")
     
@@ -524,19 +679,19 @@ class BatchProcessorWidget(QWidget):
         self.job_progress.setVisible(False)
         
         # Final status with detailed stats
-        processing_time = time.time() - self.processing_start_time if self.processing_start_time else 0
+        processing_time = time.monotonic() - self.processing_start_time if self.processing_start_time else 0
         total_files = self.completed_jobs + self.failed_jobs
         success_rate = (self.completed_jobs / total_files) * 100 if total_files > 0 else 0
         avg_time = processing_time / total_files if total_files > 0 else 0
         
-        self.stats_label.setText(
+        self._set_label_text(
+            self.stats_label,
             f"🎉 Batch Complete! {total_files} files processed\n"
             f"✅ Success: {self.completed_jobs} | ❌ Failed: {self.failed_jobs} | 📈 Rate: {success_rate:.1f}%"
         )
         
-        time_str = f"{int(processing_time // 60)}m {int(processing_time % 60)}s" if processing_time > 60 else f"{int(processing_time)}s"
-        self.time_stats_label.setText(f"🕰️ Total time: {time_str}")
-        self.file_stats_label.setText(f"📈 Average per file: {avg_time:.1f}s")
+        self._set_label_text(self.time_stats_label, f"🕰️ Total time: {self._fmt_duration(processing_time)}")
+        self._set_label_text(self.file_stats_label, f"📈 Average per file: {avg_time:.1f}s")
         
         self.processing_finished.emit()
         
@@ -546,72 +701,95 @@ class BatchProcessorWidget(QWidget):
         
         logger.info(f"Batch processing finished: {self.completed_jobs} successful, {self.failed_jobs} failed")
     
+    @staticmethod
+    def _fmt_duration(seconds: float) -> str:
+        """Format a duration as '1m 5s' or '42s'."""
+        if seconds > 60:
+            return f"{int(seconds // 60)}m {int(seconds % 60)}s"
+        return f"{int(seconds)}s"
+    
+    def _set_label_text(self, label: QLabel, text: str) -> None:
+        """Set label text, skipping the repaint if it has not changed."""
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
+    
     def _update_display(self) -> None:
         """Update display with current statistics."""
         if not self.processing_start_time:
-            self.stats_label.setText("📋 Ready - Add files to start batch processing")
-            self.time_stats_label.setText("")
-            self.file_stats_label.setText("")
+            self._set_label_text(self.stats_label, "📋 Ready - Add files to start batch processing")
+            self._set_label_text(self.time_stats_label, "")
+            self._set_label_text(self.file_stats_label, "")
             return
         
-        elapsed = time.time() - self.processing_start_time
-        processed = self.completed_jobs + self.failed_jobs
         total = len(self.jobs)
+        if total == 0 and self.completed_jobs == 0 and self.failed_jobs == 0:
+            return
+        
+        # Whole seconds, so sub-second drift does not change the text
+        elapsed = int(time.monotonic() - self.processing_start_time)
+        processed = self.completed_jobs + self.failed_jobs
         
         # Update main stats
         if total > 0:
             progress_percent = (processed / total) * 100
             success_rate = (self.completed_jobs / processed) * 100 if processed > 0 else 0
             
-            self.stats_label.setText(
-                f"⚡ Processing: {processed}/{total} files ({progress_percent:.1f}%)\n"
-                f"✅ Success: {self.completed_jobs} | ❌ Failed: {self.failed_jobs} | 📈 Rate: {success_rate:.1f}%"
+            self._set_label_text(
+                self.stats_label,
+                self.STATS_TMPL.format(
+                    p=processed, t=total, pct=progress_percent,
+                    s=self.completed_jobs, f=self.failed_jobs, r=success_rate
+                )
             )
         
         # Update timing stats
         if processed > 0:
             avg_time = elapsed / processed
             remaining = total - processed
-            eta = remaining * avg_time
+            eta = int(remaining * avg_time)
             
-            eta_str = f"{int(eta // 60)}m {int(eta % 60)}s" if eta > 60 else f"{int(eta)}s"
-            elapsed_str = f"{int(elapsed // 60)}m {int(elapsed % 60)}s" if elapsed > 60 else f"{int(elapsed)}s"
-            
-            self.time_stats_label.setText(f"🕰️ Elapsed: {elapsed_str} | ETA: {eta_str}")
-            self.file_stats_label.setText(f"📈 Avg per file: {avg_time:.1f}s | Remaining: {remaining} files")
+            self._set_label_text(
+                self.time_stats_label,
+                self.TIME_TMPL.format(elapsed=self._fmt_duration(elapsed), eta=self._fmt_duration(eta))
+            )
+            self._set_label_text(
+                self.file_stats_label,
+                self.FILE_TMPL.format(avg=avg_time, remaining=remaining)
+            )
         else:
-            elapsed_str = f"{int(elapsed // 60)}m {int(elapsed % 60)}s" if elapsed > 60 else f"{int(elapsed)}s"
-            self.time_stats_label.setText(f"🕰️ Elapsed: {elapsed_str} | Initializing...")
-            self.file_stats_label.setText("📈 Preparing files for processing...")
-        
-        # Statistics
-        stats_parts = []
-        if processed > 0:
-            stats_parts.append(f"Processed: {processed}/{total}")
-        if self.completed_jobs > 0:
-            stats_parts.append(f"Successful: {self.completed_jobs}")
-        if self.failed_jobs > 0:
-            stats_parts.append(f"Failed: {self.failed_jobs}")
-        if elapsed > 0:
-            stats_parts.append(f"Time: {int(elapsed // 60)}m {int(elapsed % 60)}s")
+            self._set_label_text(self.time_stats_label, f"🕰️ Elapsed: {self._fmt_duration(elapsed)} | Initializing...")
+            self._set_label_text(self.file_stats_label, "📈 Preparing files for processing...")
+    
+    def _flush_file_status(self) -> None:
+        """Apply queued file list status updates in one batch."""
+        if not self._pending_status:
+            return
         
-        self.stats_label.setText(" | ".join(stats_parts) if stats_parts else "Processing...")
+        file_list = self._get_file_list()
+        if file_list is not None:
+            file_list.update_files_status(self._pending_status)
+        self._pending_status = {}
+    
+    def _get_file_list(self):
+        """Get the main window's file list, resolving it only once."""
+        file_list = self._file_list_ref() if self._file_list_ref is not None else None
+        if file_list is None:
+            file_list = getattr(self.window(), 'file_list', None)
+            if file_list is not None:
+                self._file_list_ref = weakref.ref(file_list)
+        return file_list
     
     def _auto_clear_completed(self) -> None:
         """Auto-clear completed files from the list."""
-        main_window = self.window()
-        if hasattr(main_window, 'file_list'):
-            # Remove completed items
-            for job in self.jobs:
-                if job.is_complete and job.stage.name == 'COMPLETE':
-                    # Find and remove from file list
-                    for i in range(main_window.file_list.list_widget.count()):
-                        item = main_window.file_list.list_widget.item(i)
-                        if hasattr(item, 'file_path') and item.file_path == job.input_path:
-                            main_window.file_list.list_widget.takeItem(i)
-                            break
-            
-            main_window.file_list.files_changed.emit(main_window.file_list.list_widget.count())
+        completed = {job.input_path for job in self.jobs
+                     if job.is_complete and job.stage is ProcessingStage.COMPLETE}
+        if not completed:
+            return
+        
+        file_list = self._get_file_list()
+        if file_list is not None:
+            file_list.remove_files(completed)
             logger.info("Auto-cleared completed files from list")
     
     def closeEvent(self, event) -> None:
@@ -619,9 +797,16 @@ class BatchProcessorWidget(QWidget):
         if self.is_processing():
             self.stop_processing()
         
+        # Release a paused worker and cancel in-flight jobs so the thread
+        # can exit promptly instead of freezing the close
+        self.worker.stop_processing()
+        
         # Clean up worker thread
+        self.worker.shutdown()
         if self.worker_thread.isRunning():
             self.worker_thread.quit()
-            self.worker_thread.wait(3000)  # Wait up to 3 seconds
+            if not self.worker_thread.wait(500):
+                self.worker_thread.requestInterruption()
+                self.worker_thread.wait(500)
         
         event.accept()
\ No newline at end of file
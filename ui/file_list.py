@@ -1,14 +1,15 @@
 """File list widget for managing audio/video files."""
 
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, ClassVar
 from enum import Enum
+from dataclasses import dataclass, field
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView, QAbstractItemView,
     QPushButton, QLabel, QProgressBar, QMenu, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, QMimeData, QTimer
+from PySide6.QtCore import Qt, Signal, QMimeData, QAbstractListModel, QModelIndex
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QIcon, QPixmap, QPainter, QBrush
 
 from utils.logging_setup import get_logger
@@ -27,105 +28,130 @@ class FileStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class FileItem(QListWidgetItem):
-    """Custom list item for files with status tracking."""
+def _create_audio_icon() -> QIcon:
+    """Create audio file icon."""
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(Qt.transparent)
     
-    def __init__(self, file_path: Path):
-        super().__init__()
+    painter = QPainter(pixmap)
+    painter.setBrush(QBrush(Qt.blue))
+    painter.drawEllipse(2, 2, 12, 12)
+    painter.end()
+    
+    return QIcon(pixmap)
+
+
+def _create_video_icon() -> QIcon:
+    """Create video file icon."""
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setBrush(QBrush(Qt.red))
+    painter.drawRect(2, 2, 12, 12)
+    painter.end()
+    
+    return QIcon(pixmap)
+
+
+# Type icons are constant, so they are painted once on first use (a
+# QPixmap needs the QApplication to exist)
+_AUDIO_ICON: Optional[QIcon] = None
+_VIDEO_ICON: Optional[QIcon] = None
+
+
+def _get_icons() -> Tuple[QIcon, QIcon]:
+    """Get the cached audio and video icons."""
+    global _AUDIO_ICON, _VIDEO_ICON
+    if _AUDIO_ICON is None:
+        _AUDIO_ICON = _create_audio_icon()
+        _VIDEO_ICON = _create_video_icon()
+    return _AUDIO_ICON, _VIDEO_ICON
+
+
+@dataclass
+class FileRecord:
+    """A file in the list with its processing status."""
+    path: Path
+    status: FileStatus = FileStatus.PENDING
+    progress: float = 0.0
+    message: str = ""
+    error: str = ""
+    output_path: Optional[Path] = None
+    job: Optional[ProcessingJob] = None
+    
+    # Rendered display state
+    snapshot: Optional[tuple] = field(init=False, default=None, repr=False)
+    is_video: bool = field(init=False, default=False)
+    text: str = field(init=False, default="")
+    _name: str = field(init=False, default="", repr=False)
+    _last_rendered: Optional[tuple] = field(init=False, default=None, repr=False)
+    
+    # Text appended to the file name for settled statuses
+    _STATUS_SUFFIX: ClassVar[Dict[FileStatus, str]] = {
+        FileStatus.COMPLETED: " ✓",
+        FileStatus.ERROR: " ✗",
+        FileStatus.CANCELLED: " (cancelled)",
+    }
+    
+    def __post_init__(self):
+        """Initialize display state."""
+        self.is_video = is_video_file(self.path)
         
-        self.file_path = file_path
-        self.status = FileStatus.PENDING
-        self.progress = 0.0
-        self.message = ""
-        self.error_message = ""
-        self.output_path: Optional[Path] = None
-        self.processing_job: Optional[ProcessingJob] = None
+        filename = self.path.name
+        if len(filename) > 50:
+            filename = filename[:47] + "..."
+        self._name = filename
         
         self._update_display()
     
     def _update_display(self) -> None:
-        """Update the display text and icon."""
-        # Set main text
-        filename = self.file_path.name
-        if len(filename) > 50:
-            filename = filename[:47] + "..."
-        
-        text = filename
+        """Update the display text when a shown field changed."""
+        percent = round(self.progress)
+        rendered = (self.status, percent, self.message, self.error)
+        if rendered == self._last_rendered:
+            return
+        self._last_rendered = rendered
         
         # Add status information
         if self.status == FileStatus.PROCESSING:
-            text += f" ({self.progress:.0f}%"
             if self.message:
-                text += f" - {self.message}"
-            text += ")"
-        elif self.status == FileStatus.COMPLETED:
-            text += " ✓"
-        elif self.status == FileStatus.ERROR:
-            text += " ✗"
-            if self.error_message:
-                text += f" - {self.error_message}"
-        elif self.status == FileStatus.CANCELLED:
-            text += " (cancelled)"
-        
-        self.setText(text)
-        
-        # Set icon based on file type
-        if is_video_file(self.file_path):
-            self.setIcon(self._create_video_icon())
+                self.text = f"{self._name} ({percent}% - {self.message})"
+            else:
+                self.text = f"{self._name} ({percent}%)"
+        elif self.status == FileStatus.ERROR and self.error:
+            self.text = f"{self._name} ✗ - {self.error}"
         else:
-            self.setIcon(self._create_audio_icon())
-        
-        # Set tooltip
+            self.text = self._name + self._STATUS_SUFFIX.get(self.status, "")
+    
+    def tooltip(self) -> str:
+        """Build the tooltip text; only called when a tooltip is shown."""
         tooltip_parts = [
-            f"Path: {self.file_path}",
+            f"Path: {self.path}",
             f"Status: {self.status.value}"
         ]
         
         if self.output_path:
             tooltip_parts.append(f"Output: {self.output_path}")
         
-        if self.error_message:
-            tooltip_parts.append(f"Error: {self.error_message}")
-        
-        self.setToolTip("\n".join(tooltip_parts))
-    
-    def _create_audio_icon(self) -> QIcon:
-        """Create audio file icon."""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setBrush(QBrush(Qt.blue))
-        painter.drawEllipse(2, 2, 12, 12)
-        painter.end()
+        if self.error:
+            tooltip_parts.append(f"Error: {self.error}")
         
-        return QIcon(pixmap)
-    
-    def _create_video_icon(self) -> QIcon:
-        """Create video file icon."""
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setBrush(QBrush(Qt.red))
-        painter.drawRect(2, 2, 12, 12)
-        painter.end()
-        
-        return QIcon(pixmap)
+        return "\n".join(tooltip_parts)
     
     def update_status(self, status: FileStatus, progress: float = 0.0, 
-                     message: str = "", error_message: str = "") -> None:
-        """Update item status and refresh display."""
+                     message: str = "", error: str = "") -> None:
+        """Update record status and refresh display."""
         self.status = status
         self.progress = progress
         self.message = message
-        self.error_message = error_message
+        self.error = error
         
         self._update_display()
     
     def update_from_job(self, job: ProcessingJob) -> None:
         """Update status from processing job."""
-        self.processing_job = job
+        self.job = job
         self.output_path = job.output_path
         
         # Map job stage to status
@@ -144,10 +170,118 @@ class FileItem(QListWidgetItem):
             status=status,
             progress=job.progress * 100,
             message=job.message,
-            error_message=job.error_message
+            error=job.error_message
         )
 
 
+class FileListModel(QAbstractListModel):
+    """List model holding file records, indexed by path."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._records: List[FileRecord] = []
+        self._index: Dict[Path, int] = {}
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of files in the list."""
+        if parent.isValid():
+            return 0
+        return len(self._records)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return display data for a row."""
+        if not index.isValid():
+            return None
+        
+        record = self._records[index.row()]
+        if role == Qt.DisplayRole:
+            return record.text
+        if role == Qt.DecorationRole:
+            audio_icon, video_icon = _get_icons()
+            return video_icon if record.is_video else audio_icon
+        if role == Qt.ToolTipRole:
+            return record.tooltip()
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Rows are selectable but not editable."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def record(self, row: int) -> Optional[FileRecord]:
+        """Get the record at a row."""
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+    
+    def records(self) -> List[FileRecord]:
+        """Get all records."""
+        return list(self._records)
+    
+    def contains(self, path: Path) -> bool:
+        """Check if a file is already in the model."""
+        return path in self._index
+    
+    def add_files(self, paths: List[Path]) -> None:
+        """Append files to the model with a single row insertion."""
+        if not paths:
+            return
+        
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        for row, path in enumerate(paths, first):
+            self._records.append(FileRecord(path))
+            self._index[path] = row
+        self.endInsertRows()
+    
+    def remove_rows(self, rows: List[int]) -> None:
+        """Remove rows, highest first so earlier rows keep their index."""
+        for row in sorted(set(rows), reverse=True):
+            if 0 <= row < len(self._records):
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._records[row]
+                self.endRemoveRows()
+        self._rebuild_index()
+    
+    def remove_paths(self, paths) -> int:
+        """Remove the given files; returns the number removed."""
+        rows = [self._index[path] for path in paths if path in self._index]
+        self.remove_rows(rows)
+        return len(rows)
+    
+    def clear(self) -> None:
+        """Remove all files."""
+        self.beginResetModel()
+        self._records.clear()
+        self._index.clear()
+        self.endResetModel()
+    
+    def update_job(self, path: Path, job: ProcessingJob) -> None:
+        """Update a file's status from its job and repaint its row if it changed."""
+        row = self._index.get(path)
+        if row is None:
+            return
+        
+        # Whole-percent buckets, so sub-1% progress doesn't trigger a repaint
+        record = self._records[row]
+        snapshot = (job.stage, int(job.progress * 100), job.message,
+                    job.error_message, job.output_path)
+        if snapshot == record.snapshot:
+            record.job = job
+            return
+        
+        record.snapshot = snapshot
+        record.update_from_job(job)
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole])
+    
+    def _rebuild_index(self) -> None:
+        """Rebuild the path to row index."""
+        self._index = {record.path: row for row, record in enumerate(self._records)}
+
+
 class FileListWidget(QWidget):
     """Widget for managing the list of files to process."""
     
@@ -161,11 +295,6 @@ class FileListWidget(QWidget):
         self._setup_ui()
         self._connect_signals()
         
-        # Update timer for progress display
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_display)
-        self.update_timer.start(100)  # Update every 100ms
-        
         logger.debug("File list widget initialized")
     
     def _setup_ui(self) -> None:
@@ -186,10 +315,14 @@ class FileListWidget(QWidget):
         
         layout.addLayout(header_layout)
         
-        # File list
-        self.list_widget = QListWidget()
+        # File list; a model/view so only visible rows are laid out and painted
+        self.model = FileListModel(self)
+        self.list_widget = QListView()
+        self.list_widget.setModel(self.model)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setLayoutMode(QListView.Batched)
         self.list_widget.setAcceptDrops(True)
-        self.list_widget.setDragDropMode(QListWidget.DropOnly)
+        self.list_widget.setDragDropMode(QAbstractItemView.DropOnly)
         self.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         layout.addWidget(self.list_widget)
         
@@ -214,20 +347,19 @@ class FileListWidget(QWidget):
     
     def _connect_signals(self) -> None:
         """Connect widget signals."""
-        self.list_widget.itemSelectionChanged.connect(self._on_selection_changed)
+        self.list_widget.selectionModel().currentChanged.connect(self._on_selection_changed)
         self.list_widget.customContextMenuRequested.connect(self._show_context_menu)
-        self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
-    
-    def _update_display(self) -> None:
-        """Update display elements."""
-        count = self.list_widget.count()
-        self.file_count_label.setText(f"{count} files")
+        self.list_widget.doubleClicked.connect(self._on_item_double_clicked)
         
-        # Update progress display for processing items
-        for i in range(count):
-            item = self.list_widget.item(i)
-            if isinstance(item, FileItem) and item.processing_job:
-                item.update_from_job(item.processing_job)
+        # Row updates arrive from job status changes; only the count needs
+        # refreshing when rows come and go
+        self.model.rowsInserted.connect(self._update_file_count)
+        self.model.rowsRemoved.connect(self._update_file_count)
+        self.model.modelReset.connect(self._update_file_count)
+    
+    def _update_file_count(self) -> None:
+        """Update the file count label."""
+        self.file_count_label.setText(f"{self.model.rowCount()} files")
     
     def add_files(self, file_paths: List[Path]) -> None:
         """
@@ -236,75 +368,75 @@ class FileListWidget(QWidget):
         Args:
             file_paths: List of file paths to add
         """
-        added_count = 0
+        new_files = []
+        seen = set()
         
+        # Cheapest checks first; the existence check is the only one that
+        # touches the filesystem
         for file_path in file_paths:
-            if not file_path.exists():
-                logger.warning(f"File does not exist: {file_path}")
+            # Check if file is already in list
+            if self._is_file_in_list(file_path) or file_path in seen:
+                logger.debug(f"File already in list: {file_path}")
                 continue
             
             if not is_media_file(file_path):
                 logger.warning(f"Unsupported file type: {file_path}")
                 continue
             
-            # Check if file is already in list
-            if self._is_file_in_list(file_path):
-                logger.debug(f"File already in list: {file_path}")
+            if not file_path.exists():
+                logger.warning(f"File does not exist: {file_path}")
                 continue
             
-            # Add file item
-            item = FileItem(file_path)
-            self.list_widget.addItem(item)
-            added_count += 1
-        
-        if added_count > 0:
-            logger.info(f"Added {added_count} files to list")
-            self.files_changed.emit(self.list_widget.count())
+            seen.add(file_path)
+            new_files.append(file_path)
+        
+        if new_files:
+            # Hold repaints so a large batch lands in a single update
+            self.list_widget.setUpdatesEnabled(False)
+            try:
+                self.model.add_files(new_files)
+            finally:
+                self.list_widget.setUpdatesEnabled(True)
+            logger.info(f"Added {len(new_files)} files to list")
+            self.files_changed.emit(self.model.rowCount())
     
     def _is_file_in_list(self, file_path: Path) -> bool:
         """Check if file is already in the list."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if isinstance(item, FileItem) and item.file_path == file_path:
-                return True
-        return False
+        return self.model.contains(file_path)
     
     def get_all_files(self) -> List[Path]:
         """Get all files in the list."""
-        files = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if isinstance(item, FileItem):
-                files.append(item.file_path)
-        return files
+        return [record.path for record in self.model.records()]
     
     def get_current_file(self) -> Optional[Path]:
         """Get currently selected file."""
-        current_item = self.list_widget.currentItem()
-        if isinstance(current_item, FileItem):
-            return current_item.file_path
+        record = self.model.record(self.list_widget.currentIndex().row())
+        if record is not None:
+            return record.path
         return None
     
-    def get_file_items(self) -> List[FileItem]:
-        """Get all file items."""
-        items = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if isinstance(item, FileItem):
-                items.append(item)
-        return items
+    def get_file_items(self) -> List[FileRecord]:
+        """Get all file records."""
+        return self.model.records()
     
     def update_file_status(self, file_path: Path, job: ProcessingJob) -> None:
         """Update status of a specific file."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if isinstance(item, FileItem) and item.file_path == file_path:
-                item.update_from_job(job)
-                break
+        self.model.update_job(file_path, job)
+    
+    def update_files_status(self, jobs: Dict[Path, ProcessingJob]) -> None:
+        """Update the status of several files."""
+        for file_path, job in jobs.items():
+            self.model.update_job(file_path, job)
+    
+    def remove_files(self, file_paths) -> None:
+        """Remove the given files from the list."""
+        removed = self.model.remove_paths(file_paths)
+        if removed:
+            self.files_changed.emit(self.model.rowCount())
     
     def clear(self) -> None:
         """Clear all files from the list."""
-        if self.list_widget.count() > 0:
+        if self.model.rowCount() > 0:
             reply = QMessageBox.question(
                 self,
                 "Clear File List",
@@ -314,7 +446,7 @@ class FileListWidget(QWidget):
             )
             
             if reply == QMessageBox.Yes:
-                self.list_widget.clear()
+                self.model.clear()
                 self.files_changed.emit(0)
                 logger.info("File list cleared")
     
@@ -327,66 +459,62 @@ class FileListWidget(QWidget):
     
     def _remove_selected(self) -> None:
         """Remove selected files from the list."""
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
+        rows = [index.row() for index in self.list_widget.selectionModel().selectedIndexes()]
+        if not rows:
             return
         
-        for item in selected_items:
-            row = self.list_widget.row(item)
-            self.list_widget.takeItem(row)
+        self.model.remove_rows(rows)
         
-        self.files_changed.emit(self.list_widget.count())
-        logger.info(f"Removed {len(selected_items)} files from list")
+        self.files_changed.emit(self.model.rowCount())
+        logger.info(f"Removed {len(rows)} files from list")
     
-    def _on_selection_changed(self) -> None:
+    def _on_selection_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
         """Handle selection change."""
-        current_item = self.list_widget.currentItem()
-        self.remove_button.setEnabled(current_item is not None)
+        record = self.model.record(current.row()) if current.isValid() else None
+        self.remove_button.setEnabled(record is not None)
         
-        if isinstance(current_item, FileItem):
-            self.selection_changed.emit(current_item.file_path)
+        if record is not None:
+            self.selection_changed.emit(record.path)
         else:
             self.selection_changed.emit(None)
     
     def _show_context_menu(self, position) -> None:
         """Show context menu for file list."""
-        item = self.list_widget.itemAt(position)
-        if not isinstance(item, FileItem):
+        record = self.model.record(self.list_widget.indexAt(position).row())
+        if record is None:
             return
         
         menu = QMenu(self)
         
         # Remove action
         remove_action = menu.addAction("Remove from List")
-        remove_action.triggered.connect(lambda: self._remove_file_item(item))
+        remove_action.triggered.connect(lambda: self._remove_file_item(record))
         
         # Show in explorer action
-        if item.file_path.exists():
+        if record.path.exists():
             show_action = menu.addAction("Show in File Explorer")
-            show_action.triggered.connect(lambda: self._show_in_explorer(item.file_path))
+            show_action.triggered.connect(lambda: self._show_in_explorer(record.path))
         
         # Show output action
-        if item.status == FileStatus.COMPLETED and item.output_path and item.output_path.exists():
+        if record.status == FileStatus.COMPLETED and record.output_path and record.output_path.exists():
             menu.addSeparator()
             show_output_action = menu.addAction("Show Output File")
-            show_output_action.triggered.connect(lambda: self._show_in_explorer(item.output_path))
+            show_output_action.triggered.connect(lambda: self._show_in_explorer(record.output_path))
             
             open_output_action = menu.addAction("Open Output File")
-            open_output_action.triggered.connect(lambda: self._open_file(item.output_path))
+            open_output_action.triggered.connect(lambda: self._open_file(record.output_path))
         
         # Copy path action
         menu.addSeparator()
         copy_path_action = menu.addAction("Copy Path")
-        copy_path_action.triggered.connect(lambda: self._copy_path(item.file_path))
+        copy_path_action.triggered.connect(lambda: self._copy_path(record.path))
         
         if menu.actions():
-            menu.exec(self.list_widget.mapToGlobal(position))
+            menu.exec(self.list_widget.viewport().mapToGlobal(position))
     
-    def _remove_file_item(self, item: FileItem) -> None:
-        """Remove a specific file item."""
-        row = self.list_widget.row(item)
-        self.list_widget.takeItem(row)
-        self.files_changed.emit(self.list_widget.count())
+    def _remove_file_item(self, record: FileRecord) -> None:
+        """Remove a specific file record."""
+        self.remove_files([record.path])
     
     def _show_in_explorer(self, file_path: Path) -> None:
         """Show file in system file explorer."""
@@ -426,13 +554,14 @@ class FileListWidget(QWidget):
         clipboard = QApplication.clipboard()
         clipboard.setText(str(file_path))
     
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle item double click."""
-        if isinstance(item, FileItem):
-            if item.status == FileStatus.COMPLETED and item.output_path and item.output_path.exists():
-                self._open_file(item.output_path)
+        record = self.model.record(index.row())
+        if record is not None:
+            if record.status == FileStatus.COMPLETED and record.output_path and record.output_path.exists():
+                self._open_file(record.output_path)
             else:
-                self._open_file(item.file_path)
+                self._open_file(record.path)
     
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter event."""
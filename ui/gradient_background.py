@@ -1,97 +1,182 @@
 """Gradient background widget with particle effects and animations."""
 
-import math
 import random
+from collections import deque
+
+import numpy as np
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve, Qt
-from PySide6.QtGui import QPainter, QLinearGradient, QRadialGradient, QColor, QBrush, QPainterPath
+from PySide6.QtCore import QTimer, QPropertyAnimation, QEasingCurve, Qt, QRectF, QPointF, Property, QEvent
+from PySide6.QtGui import (
+    QGuiApplication, QSurfaceFormat, QPainter, QLinearGradient, QRadialGradient,
+    QColor, QBrush, QPainterPath, QPixmap, QPolygonF
+)
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support
+    QOpenGLWidget = None
 
-class Particle:
-    """A single particle for background animation."""
-    
-    def __init__(self, x, y, vx, vy, size, color, lifetime=5000):
-        self.x = x
-        self.y = y
-        self.vx = vx  # velocity x
-        self.vy = vy  # velocity y
-        self.size = size
-        self.color = color
-        self.lifetime = lifetime
-        self.age = 0
-        self.opacity = 1.0
-    
-    def update(self, dt=16):
-        """Update particle position and properties."""
-        self.x += self.vx * dt / 1000.0
-        self.y += self.vy * dt / 1000.0
-        self.age += dt
-        
-        # Fade out as particle ages
-        if self.age > self.lifetime * 0.7:
-            fade_progress = (self.age - self.lifetime * 0.7) / (self.lifetime * 0.3)
-            self.opacity = max(0, 1.0 - fade_progress)
-        
-        return self.age < self.lifetime
+# Render through the OpenGL paint engine when Qt has it, else plain raster
+_Base = QOpenGLWidget if QOpenGLWidget is not None else QWidget
 
 
-class GradientBackgroundWidget(QWidget):
-    """Widget with animated gradient background and floating particles."""
+class GradientBackgroundWidget(_Base):
+    """Widget with animated gradient background and floating particles.
+    
+    Rendered through Qt's OpenGL paint engine when available, so gradient
+    fills and alpha blending run on the GPU.
+    """
+    
+    # Frame intervals while the application is active / in the background
+    ACTIVE_INTERVAL_MS = 16  # ~60 FPS
+    INACTIVE_INTERVAL_MS = 200
+    
+    # Particle state lives in fixed-size parallel arrays, one slot per particle
+    MAX_PARTICLES = 64
+    DOT_SIZE = 16
+    ALPHA_LEVELS = 16
+    
+    # Purple/blue particle palette (r, g, b); alpha comes from each particle's opacity
+    PARTICLE_COLORS = [
+        (88, 101, 242),
+        (101, 116, 255),
+        (117, 132, 255),
+        (255, 255, 255)
+    ]
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.particles = []
+        if _Base is not QWidget:
+            surface_format = QSurfaceFormat()
+            surface_format.setSamples(4)
+            self.setFormat(surface_format)
+        
+        # Set while an opaque child hides the whole background
+        self._fully_covered = False
+        
         self.gradient_offset = 0
         self.wave_offset = 0
         
+        # Wave paths, tessellated per size
+        self._wave_path = None
+        
+        # Rendered gradient background, keyed by hue and size
+        self._bg_cache = None
+        self._bg_cache_hue = None
+        self._bg_cache_size = None
+        
+        # Particle arrays
+        n = self.MAX_PARTICLES
+        self._px = np.zeros(n, np.float32)
+        self._py = np.zeros(n, np.float32)
+        self._vx = np.zeros(n, np.float32)
+        self._vy = np.zeros(n, np.float32)
+        self._size = np.zeros(n, np.float32)
+        self._age = np.zeros(n, np.float32)
+        self._lifetime = np.ones(n, np.float32)
+        self._opacity = np.ones(n, np.float32)
+        self._color_idx = np.zeros(n, np.int8)
+        self._alive = np.zeros(n, bool)
+        self._free_slots = deque(range(n))
+        self._rng = np.random.default_rng()
+        
+        # Pre-rendered dots keyed by (palette colour, alpha level), scaled
+        # when drawn
+        self._dots = {}
+        self._dot_rect = QRectF(0, 0, self.DOT_SIZE, self.DOT_SIZE)
+        
         # Animation timer
+        self._animation_enabled = True
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.update_animation)
-        self.animation_timer.start(16)  # ~60 FPS
+        self.animation_timer.start(self._frame_interval())
         
         # Particle spawn timer
         self.particle_timer = QTimer()
         self.particle_timer.timeout.connect(self.spawn_particles)
         self.particle_timer.start(2000)  # Spawn particles every 2 seconds
         
+        # Slow down while the application is in the background
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state_changed)
+        
         # Spawn initial particles
         self.spawn_initial_particles()
     
+    def _dot(self, color_idx, alpha_idx):
+        """Get the dot pixmap for a palette colour at a quantized opacity."""
+        key = (color_idx, alpha_idx)
+        dot = self._dots.get(key)
+        if dot is None:
+            r, g, b = self.PARTICLE_COLORS[color_idx]
+            dot = self._render_dot(QColor(r, g, b, 255 * alpha_idx // self.ALPHA_LEVELS))
+            self._dots[key] = dot
+        return dot
+    
+    def _render_dot(self, color):
+        """Render a filled particle dot in the given colour."""
+        pixmap = QPixmap(self.DOT_SIZE, self.DOT_SIZE)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(QBrush(color))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, self.DOT_SIZE, self.DOT_SIZE)
+        painter.end()
+        
+        return pixmap
+    
+    def _release(self, dead):
+        """Return the slots in the dead mask to the free list."""
+        slots = np.flatnonzero(dead)
+        if slots.size:
+            self._alive[slots] = False
+            self._free_slots.extend(slots.tolist())
+    
     def spawn_initial_particles(self):
         """Spawn initial set of particles."""
-        for _ in range(20):
-            self.spawn_particle()
+        self.spawn_particles(20)
     
     def spawn_particle(self):
         """Spawn a single particle."""
-        x = random.uniform(-50, self.width() + 50)
-        y = random.uniform(-50, self.height() + 50)
-        vx = random.uniform(-20, 20)
-        vy = random.uniform(-30, -10)  # Generally move upward
-        size = random.uniform(2, 8)
+        self.spawn_particles(1)
+    
+    def spawn_particles(self, count=2):
+        """Spawn a batch of particles into free slots."""
+        count = min(count, len(self._free_slots))
+        if count == 0:
+            return
+        slots = [self._free_slots.popleft() for _ in range(count)]
+        
+        rng = self._rng
+        self._px[slots] = rng.uniform(-50, self.width() + 50, count)
+        self._py[slots] = rng.uniform(-50, self.height() + 50, count)
+        self._vx[slots] = rng.uniform(-20, 20, count)
+        self._vy[slots] = rng.uniform(-30, -10, count)  # Generally move upward
+        self._size[slots] = rng.uniform(2, 8, count)
         
         # Random color from purple/blue palette
-        colors = [
-            QColor(88, 101, 242, 80),
-            QColor(101, 116, 255, 60),
-            QColor(117, 132, 255, 40),
-            QColor(255, 255, 255, 30)
-        ]
-        color = random.choice(colors)
+        self._color_idx[slots] = rng.integers(0, len(self.PARTICLE_COLORS), count)
         
-        lifetime = random.uniform(8000, 15000)
-        particle = Particle(x, y, vx, vy, size, color, lifetime)
-        self.particles.append(particle)
-    
-    def spawn_particles(self):
-        """Spawn new particles periodically."""
-        for _ in range(2):
-            self.spawn_particle()
+        self._lifetime[slots] = rng.uniform(8000, 15000, count)
+        self._age[slots] = 0
+        self._opacity[slots] = 1.0
+        self._alive[slots] = True
     
-    def update_animation(self):
+    def update_animation(self, dt=16):
         """Update animation state."""
-        # Update particles
-        self.particles = [p for p in self.particles if p.update()]
+        # Update all particles at once; dead slots are ignored when drawing
+        self._px += self._vx * (dt / 1000.0)
+        self._py += self._vy * (dt / 1000.0)
+        self._age += dt
+        
+        # Fade out over the last 30% of each particle's lifetime
+        fade_start = self._lifetime * 0.7
+        np.clip(1.0 - (self._age - fade_start) / (self._lifetime * 0.3), 0.0, 1.0,
+                out=self._opacity)
+        self._release(self._alive & (self._age >= self._lifetime))
         
         # Update gradient animation
         self.gradient_offset = (self.gradient_offset + 0.5) % 360
@@ -103,6 +188,23 @@ class GradientBackgroundWidget(QWidget):
     
     def paintEvent(self, event):
         """Paint the gradient background and particles."""
+        if self._fully_covered:
+            return
+        
+        if _Base is not QWidget:
+            # QOpenGLWidget renders through paintGL
+            super().paintEvent(event)
+            return
+        
+        self._paint()
+    
+    def paintGL(self):
+        """Paint the background with the OpenGL paint engine."""
+        if not self._fully_covered:
+            self._paint()
+    
+    def _paint(self):
+        """Paint the gradient background, particles and waves."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
@@ -114,15 +216,36 @@ class GradientBackgroundWidget(QWidget):
         
         # Draw subtle wave overlay
         self.draw_wave_overlay(painter)
+        painter.end()
     
     def draw_gradient_background(self, painter):
-        """Draw the main gradient background."""
+        """Draw the main gradient background from a cached pixmap."""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        
+        # Colours only change with the whole-degree hue, so re-render the
+        # background when that or the size changes
+        base_hue = int((self.gradient_offset * 0.5) % 360)
+        dpr = self.devicePixelRatioF()
+        if (self._bg_cache is None or self._bg_cache_hue != base_hue
+                or self._bg_cache_size != (self.size(), dpr)):
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            cache_painter = QPainter(pixmap)
+            self._render_gradient_background(cache_painter, base_hue)
+            cache_painter.end()
+            
+            self._bg_cache = pixmap
+            self._bg_cache_hue = base_hue
+            self._bg_cache_size = (self.size(), dpr)
+        
+        painter.drawPixmap(0, 0, self._bg_cache)
+    
+    def _render_gradient_background(self, painter, base_hue):
+        """Render the gradient background for a hue."""
         # Create animated gradient
         gradient = QLinearGradient(0, 0, self.width(), self.height())
         
-        # Calculate animated colors based on offset
-        base_hue = (self.gradient_offset * 0.5) % 360
-        
         # Create smooth color transitions
         color1 = QColor.fromHsv(int(base_hue % 360), 80, 40)  # Dark base
         color2 = QColor.fromHsv(int((base_hue + 30) % 360), 90, 35)  # Mid tone
@@ -148,103 +271,187 @@ class GradientBackgroundWidget(QWidget):
     
     def draw_particles(self, painter):
         """Draw floating particles."""
-        for particle in self.particles:
-            # Set particle opacity
-            color = QColor(particle.color)
-            color.setAlphaF(particle.opacity)
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            
-            # Draw particle as a circle
-            painter.drawEllipse(
-                int(particle.x - particle.size / 2),
-                int(particle.y - particle.size / 2),
-                int(particle.size),
-                int(particle.size)
-            )
+        alive = np.flatnonzero(self._alive)
+        if alive.size == 0:
+            return
+        
+        sizes = self._size[alive]
+        xs = self._px[alive] - sizes / 2
+        ys = self._py[alive] - sizes / 2
+        alpha_idx = (self._opacity[alive] * self.ALPHA_LEVELS).astype(np.int8)
+        
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        for x, y, size, color_idx, level in zip(
+            xs.tolist(), ys.tolist(), sizes.tolist(),
+            self._color_idx[alive].tolist(), alpha_idx.tolist()
+        ):
+            if level:
+                painter.drawPixmap(QRectF(x, y, size, size), self._dot(color_idx, level), self._dot_rect)
     
-    def draw_wave_overlay(self, painter):
-        """Draw subtle wave overlay effect."""
-        painter.setPen(Qt.NoPen)
+    def _build_wave_paths(self):
+        """Tessellate both waves once for the current size.
+        
+        Each path spans an extra wavelength, so animating the wave is just
+        a horizontal translation of the same path.
+        """
+        width = self.width()
+        height = self.height()
+        wave_height = 30
+        self._wave_length = max(width / 3, 1.0)
+        self._wave_length2 = self._wave_length * 1.5
+        
+        # Coarser sampling on wide windows keeps the vertex count flat
+        step = max(8, width // 160)
         
-        # Create wave path
+        # Main wave, shifted left as the offset grows
+        xs = np.arange(0, width + self._wave_length + step, step, dtype=np.float32)
+        ys = height / 2 + wave_height * np.sin(xs * (2 * np.pi / self._wave_length))
         wave_path = QPainterPath()
-        wave_height = 30
-        wave_length = self.width() / 3
-        
-        # Start the wave
-        wave_path.moveTo(0, self.height() / 2 + wave_height)
-        
-        # Create smooth wave using sine function
-        for x in range(0, self.width() + 10, 10):
-            wave_x = x
-            wave_y = self.height() / 2 + wave_height * math.sin(
-                (x + self.wave_offset) * 2 * math.pi / wave_length
-            )
-            wave_path.lineTo(wave_x, wave_y)
-        
-        # Close the path at bottom
-        wave_path.lineTo(self.width(), self.height())
-        wave_path.lineTo(0, self.height())
+        wave_path.addPolygon(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+        wave_path.lineTo(float(xs[-1]), height)
+        wave_path.lineTo(0, height)
         wave_path.closeSubpath()
+        self._wave_path = wave_path
         
         # Fill with subtle gradient
-        wave_gradient = QLinearGradient(0, self.height() / 2, 0, self.height())
+        wave_gradient = QLinearGradient(0, height / 2, 0, height)
         wave_gradient.setColorAt(0, QColor(88, 101, 242, 10))
         wave_gradient.setColorAt(1, QColor(88, 101, 242, 30))
+        self._wave_brush = QBrush(wave_gradient)
         
-        painter.fillPath(wave_path, QBrush(wave_gradient))
-        
-        # Add another wave with different properties
+        # Second wave, shifted right as the offset grows
+        xs = np.arange(-self._wave_length2, width + step, step, dtype=np.float32)
+        ys = height / 3 + (wave_height * 0.5) * np.sin(xs * (2 * np.pi / self._wave_length2))
         wave_path2 = QPainterPath()
-        wave_path2.moveTo(0, self.height() / 3)
-        
-        for x in range(0, self.width() + 10, 10):
-            wave_x = x
-            wave_y = self.height() / 3 + (wave_height * 0.5) * math.sin(
-                (x - self.wave_offset * 1.5) * 2 * math.pi / (wave_length * 1.5)
-            )
-            wave_path2.lineTo(wave_x, wave_y)
-        
-        wave_path2.lineTo(self.width(), 0)
-        wave_path2.lineTo(0, 0)
+        wave_path2.addPolygon(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())]))
+        wave_path2.lineTo(float(xs[-1]), 0)
+        wave_path2.lineTo(float(xs[0]), 0)
         wave_path2.closeSubpath()
+        self._wave_path2 = wave_path2
         
-        wave_gradient2 = QLinearGradient(0, 0, 0, self.height() / 3)
+        wave_gradient2 = QLinearGradient(0, 0, 0, height / 3)
         wave_gradient2.setColorAt(0, QColor(117, 132, 255, 15))
         wave_gradient2.setColorAt(1, QColor(117, 132, 255, 5))
+        self._wave_brush2 = QBrush(wave_gradient2)
+    
+    def draw_wave_overlay(self, painter):
+        """Draw subtle wave overlay effect."""
+        if self._wave_path is None:
+            self._build_wave_paths()
+        
+        painter.setPen(Qt.NoPen)
         
-        painter.fillPath(wave_path2, QBrush(wave_gradient2))
+        painter.save()
+        painter.translate(-(self.wave_offset % self._wave_length), 0)
+        painter.fillPath(self._wave_path, self._wave_brush)
+        painter.restore()
+        
+        # Add another wave with different properties
+        painter.save()
+        painter.translate((self.wave_offset * 1.5) % self._wave_length2, 0)
+        painter.fillPath(self._wave_path2, self._wave_brush2)
+        painter.restore()
     
     def resizeEvent(self, event):
         """Handle widget resize."""
         super().resizeEvent(event)
+        self._build_wave_paths()
+        self._update_coverage()
+        
         # Remove particles that are now outside the widget
-        self.particles = [
-            p for p in self.particles 
-            if -100 < p.x < self.width() + 100 and -100 < p.y < self.height() + 100
-        ]
+        inside = ((self._px > -100) & (self._px < self.width() + 100) &
+                  (self._py > -100) & (self._py < self.height() + 100))
+        self._release(self._alive & ~inside)
+    
+    def showEvent(self, event):
+        """Resume animation when shown."""
+        super().showEvent(event)
+        if self._animation_enabled and not self._fully_covered:
+            self._start_timers()
+    
+    def hideEvent(self, event):
+        """Pause animation while hidden."""
+        super().hideEvent(event)
+        self._stop_timers()
+    
+    def childEvent(self, event):
+        """Watch child widgets that could cover the background."""
+        super().childEvent(event)
+        child = event.child()
+        if child.isWidgetType():
+            if event.added():
+                child.installEventFilter(self)
+            self._update_coverage()
+    
+    def eventFilter(self, obj, event):
+        """Re-check coverage when a child moves, resizes or changes visibility."""
+        if event.type() in (QEvent.Resize, QEvent.Move, QEvent.Show, QEvent.Hide):
+            self._update_coverage()
+        return super().eventFilter(obj, event)
+    
+    def _update_coverage(self):
+        """Stop animating while an opaque child covers the whole widget."""
+        rect = self.rect()
+        covered = any(
+            child.isVisible()
+            and (child.autoFillBackground() or child.testAttribute(Qt.WA_OpaquePaintEvent))
+            and child.geometry().contains(rect)
+            for child in self.findChildren(QWidget, options=Qt.FindDirectChildrenOnly)
+        )
+        if covered == self._fully_covered:
+            return
+        
+        self._fully_covered = covered
+        if covered:
+            self._stop_timers()
+        elif self._animation_enabled and self.isVisible():
+            self._start_timers()
+            self.update()
+    
+    def _frame_interval(self):
+        """Get the animation interval for the current application state."""
+        if QGuiApplication.applicationState() == Qt.ApplicationActive:
+            return self.ACTIVE_INTERVAL_MS
+        return self.INACTIVE_INTERVAL_MS
+    
+    def _on_application_state_changed(self, state):
+        """Throttle the animation while the application is inactive."""
+        if self.animation_timer.isActive():
+            self.animation_timer.setInterval(self._frame_interval())
+    
+    def _start_timers(self):
+        """Start the animation timers."""
+        self.animation_timer.start(self._frame_interval())
+        self.particle_timer.start(2000)
+    
+    def _stop_timers(self):
+        """Stop the animation timers."""
+        self.animation_timer.stop()
+        self.particle_timer.stop()
     
     def start_animation(self):
         """Start the background animation."""
-        self.animation_timer.start(16)
-        self.particle_timer.start(2000)
+        self._animation_enabled = True
+        self._start_timers()
     
     def stop_animation(self):
         """Stop the background animation."""
-        self.animation_timer.stop()
-        self.particle_timer.stop()
+        self._animation_enabled = False
+        self._stop_timers()
 
 
 class FloatingOrb(QWidget):
     """A single floating orb widget that can be placed anywhere."""
     
+    # Pre-rendered glow frames between 0.3 and 1.0 intensity
+    GLOW_STEPS = 8
+    GLOW_CYCLE_MS = 3500
+    
     def __init__(self, size=50, color=None, parent=None):
         super().__init__(parent)
         self.setFixedSize(size, size)
         self.size = size
         self.color = color or QColor(88, 101, 242, 100)
-        self.glow_intensity = 0.5
         
         # Floating animation
         self.float_animation = QPropertyAnimation(self, b"pos")
@@ -252,15 +459,30 @@ class FloatingOrb(QWidget):
         self.float_animation.setLoopCount(-1)
         self.float_animation.setEasingCurve(QEasingCurve.InOutSine)
         
-        # Glow animation
-        self.glow_timer = QTimer()
-        self.glow_timer.timeout.connect(self.update_glow)
-        self.glow_timer.start(50)
-        self.glow_direction = 1
+        # Glow animation, stepping through the pre-rendered frames
+        self._glow_frames = [
+            self._render_glow(0.3 + 0.7 * i / (self.GLOW_STEPS - 1))
+            for i in range(self.GLOW_STEPS)
+        ]
+        self._intensity = 0
+        self.glow_intensity = 0.3
+        
+        self.glow_animation = QPropertyAnimation(self, b"intensity")
+        self.glow_animation.setDuration(self.GLOW_CYCLE_MS)
+        self.glow_animation.setStartValue(0)
+        self.glow_animation.setKeyValueAt(0.5, self.GLOW_STEPS - 1)
+        self.glow_animation.setEndValue(0)
+        self.glow_animation.setLoopCount(-1)
+        self.glow_animation.start()
     
-    def paintEvent(self, event):
-        """Paint the floating orb."""
-        painter = QPainter(self)
+    def _render_glow(self, glow_intensity):
+        """Render the orb at a glow intensity."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.rect().size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         center = self.rect().center()
@@ -269,9 +491,8 @@ class FloatingOrb(QWidget):
         # Create radial gradient for glow effect
         gradient = QRadialGradient(center, radius)
         
-        # Animate glow intensity
-        inner_alpha = int(150 * self.glow_intensity)
-        outer_alpha = int(30 * self.glow_intensity)
+        inner_alpha = int(150 * glow_intensity)
+        outer_alpha = int(30 * glow_intensity)
         
         inner_color = QColor(self.color)
         inner_color.setAlpha(inner_alpha)
@@ -286,19 +507,25 @@ class FloatingOrb(QWidget):
         painter.setBrush(QBrush(gradient))
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, radius, radius)
-    
-    def update_glow(self):
-        """Update glow intensity."""
-        self.glow_intensity += 0.02 * self.glow_direction
+        painter.end()
         
-        if self.glow_intensity >= 1.0:
-            self.glow_intensity = 1.0
-            self.glow_direction = -1
-        elif self.glow_intensity <= 0.3:
-            self.glow_intensity = 0.3
-            self.glow_direction = 1
-        
-        self.update()
+        return pixmap
+    
+    def _get_intensity(self):
+        return self._intensity
+    
+    def _set_intensity(self, value):
+        if value != self._intensity:
+            self._intensity = value
+            self.glow_intensity = 0.3 + 0.7 * value / (self.GLOW_STEPS - 1)
+            self.update()
+    
+    intensity = Property(int, _get_intensity, _set_intensity)
+    
+    def paintEvent(self, event):
+        """Paint the floating orb."""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._glow_frames[self._intensity])
     
     def start_floating(self):
         """Start the floating animation."""
@@ -319,7 +546,7 @@ class FloatingOrb(QWidget):
     def stop_floating(self):
         """Stop the floating animation."""
         self.float_animation.stop()
-        self.glow_timer.stop()
+        self.glow_animation.stop()
 
 
 class GlassmorphismOverlay(QWidget):
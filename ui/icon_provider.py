@@ -1,9 +1,54 @@
 """Modern icon provider with SVG icons and visual effects."""
 
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QLinearGradient, QBrush, QPen
-from PySide6.QtCore import Qt, QRect, QSize
+from collections.abc import Mapping
+from functools import lru_cache, wraps
+
+from typing import Tuple
+
+from PySide6.QtGui import (
+    QIcon, QPixmap, QPixmapCache, QPicture, QPainter, QColor, QLinearGradient, QBrush, QPen,
+    QGuiApplication
+)
+from PySide6.QtCore import Qt, QRect, QRectF, QPointF, QSize, QSizeF
 from PySide6.QtSvg import QSvgRenderer
-from io import BytesIO
+
+
+@lru_cache(maxsize=128)
+def _svg_picture(svg_content: str, color: str = None) -> Tuple[QPicture, QSizeF]:
+    """Compile SVG content to a recorded QPicture, once per (svg, color).
+    
+    Replaying the picture skips both XML parsing and the SVG node walk.
+    Returns the picture and the size it was recorded at.
+    """
+    if color:
+        svg_content = svg_content.replace("currentColor", color)
+    renderer = QSvgRenderer(svg_content.encode('utf-8'))
+    
+    view_size = renderer.viewBoxF().size()
+    if view_size.isEmpty():
+        view_size = QSizeF(renderer.defaultSize())
+    
+    picture = QPicture()
+    painter = QPainter(picture)
+    renderer.render(painter, QRectF(QPointF(0, 0), view_size))
+    painter.end()
+    
+    return picture, view_size
+
+
+def _cached_icon(name: str):
+    """Serve an icon builder's pixmaps from QPixmapCache, keyed by name and size."""
+    def decorator(create):
+        @wraps(create)
+        def wrapper(size: QSize = QSize(24, 24)) -> QIcon:
+            key = f"icon:{name}:{size.width()}x{size.height()}"
+            pixmap = QPixmap()
+            if not QPixmapCache.find(key, pixmap):
+                pixmap = create(size).pixmap(size)
+                QPixmapCache.insert(key, pixmap)
+            return QIcon(pixmap)
+        return wrapper
+    return decorator
 
 
 class ModernIconProvider:
@@ -40,23 +85,46 @@ class ModernIconProvider:
     @staticmethod
     def create_svg_icon(svg_content: str, size: QSize, color: str = None) -> QIcon:
         """Create an icon from SVG content with optional color override."""
-        if color:
-            svg_content = svg_content.replace("currentColor", color)
-        
-        svg_bytes = BytesIO(svg_content.encode('utf-8'))
-        renderer = QSvgRenderer(svg_bytes.getvalue())
+        picture, view_size = _svg_picture(svg_content, color)
         
         pixmap = QPixmap(size)
         pixmap.fill(Qt.transparent)
         
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
-        renderer.render(painter)
+        if not view_size.isEmpty():
+            painter.scale(size.width() / view_size.width(), size.height() / view_size.height())
+            painter.drawPicture(0, 0, picture)
         painter.end()
         
         return QIcon(pixmap)
     
     @staticmethod
+    def create_emoji_pixmap(emoji: str, size: int = 16) -> QPixmap:
+        """Render an emoji glyph once and serve it from QPixmapCache."""
+        app = QGuiApplication.instance()
+        dpr = app.devicePixelRatio() if app else 1.0
+        
+        key = f"emoji:{emoji}:{size}@{dpr}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(key, pixmap):
+            pixmap = QPixmap(round(size * dpr), round(size * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            font = painter.font()
+            font.setPixelSize(round(size * 0.85))
+            painter.setFont(font)
+            painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, emoji)
+            painter.end()
+            
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    @staticmethod
+    @_cached_icon("play")
     def create_play_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern play icon."""
         svg = """
@@ -67,6 +135,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#57f287")
     
     @staticmethod
+    @_cached_icon("pause")
     def create_pause_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern pause icon."""
         svg = """
@@ -77,6 +146,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#5865f2")
     
     @staticmethod
+    @_cached_icon("stop")
     def create_stop_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern stop icon."""
         svg = """
@@ -87,6 +157,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#ed4245")
     
     @staticmethod
+    @_cached_icon("add")
     def create_add_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern add/plus icon."""
         svg = """
@@ -97,6 +168,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#5865f2")
     
     @staticmethod
+    @_cached_icon("settings")
     def create_settings_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern settings/gear icon."""
         svg = """
@@ -107,6 +179,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#a0a8b7")
     
     @staticmethod
+    @_cached_icon("folder")
     def create_folder_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern folder icon."""
         svg = """
@@ -117,6 +190,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#fee75c")
     
     @staticmethod
+    @_cached_icon("file")
     def create_file_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern file icon."""
         svg = """
@@ -127,6 +201,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#a0a8b7")
     
     @staticmethod
+    @_cached_icon("audio")
     def create_audio_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern audio/music icon."""
         svg = """
@@ -137,6 +212,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#5865f2")
     
     @staticmethod
+    @_cached_icon("video")
     def create_video_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create modern video icon."""
         svg = """
@@ -147,6 +223,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#ed4245")
     
     @staticmethod
+    @_cached_icon("waveform")
     def create_waveform_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create waveform visualization icon."""
         svg = """
@@ -162,6 +239,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#6574ff")
     
     @staticmethod
+    @_cached_icon("success")
     def create_success_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create success checkmark icon."""
         svg = """
@@ -173,6 +251,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#57f287")
     
     @staticmethod
+    @_cached_icon("error")
     def create_error_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create error X icon."""
         svg = """
@@ -184,6 +263,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#ed4245")
     
     @staticmethod
+    @_cached_icon("warning")
     def create_warning_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create warning triangle icon."""
         svg = """
@@ -195,6 +275,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#fee75c")
     
     @staticmethod
+    @_cached_icon("info")
     def create_info_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create info circle icon."""
         svg = """
@@ -206,6 +287,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#5865f2")
     
     @staticmethod
+    @_cached_icon("delete")
     def create_delete_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create delete trash icon."""
         svg = """
@@ -216,6 +298,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#ed4245")
     
     @staticmethod
+    @_cached_icon("clear")
     def create_clear_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create clear/remove icon."""
         svg = """
@@ -227,6 +310,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#a0a8b7")
     
     @staticmethod
+    @_cached_icon("minimize")
     def create_minimize_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create minimize icon."""
         svg = """
@@ -237,6 +321,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#a0a8b7")
     
     @staticmethod
+    @_cached_icon("maximize")
     def create_maximize_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create maximize icon."""
         svg = """
@@ -247,6 +332,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#a0a8b7")
     
     @staticmethod
+    @_cached_icon("close")
     def create_close_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create close X icon."""
         svg = """
@@ -257,6 +343,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#ed4245")
     
     @staticmethod
+    @_cached_icon("download")
     def create_download_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create download arrow icon."""
         svg = """
@@ -267,6 +354,7 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#57f287")
     
     @staticmethod
+    @_cached_icon("upload")
     def create_upload_icon(size: QSize = QSize(24, 24)) -> QIcon:
         """Create upload arrow icon."""
         svg = """
@@ -277,28 +365,37 @@ class ModernIconProvider:
         return ModernIconProvider.create_svg_icon(svg, size, "#5865f2")
 
 
+class IconTheme(Mapping):
+    """Read-only mapping of icon names to icons, built on first access."""
+    
+    NAMES = (
+        'play', 'pause', 'stop', 'add', 'settings', 'folder', 'file',
+        'audio', 'video', 'waveform', 'success', 'error', 'warning', 'info',
+        'delete', 'clear', 'minimize', 'maximize', 'close', 'download', 'upload',
+    )
+    
+    def __init__(self):
+        self._cache = {}
+    
+    def __getitem__(self, name: str) -> QIcon:
+        icon = self._cache.get(name)
+        if icon is None:
+            if name not in self.NAMES:
+                raise KeyError(name)
+            icon = getattr(ModernIconProvider, f"create_{name}_icon")()
+            self._cache[name] = icon
+        return icon
+    
+    def __iter__(self):
+        return iter(self.NAMES)
+    
+    def __len__(self) -> int:
+        return len(self.NAMES)
+
+
+ICONS = IconTheme()
+
+
 def get_icon_theme():
-    """Get a dictionary of all available modern icons."""
-    return {
-        'play': ModernIconProvider.create_play_icon(),
-        'pause': ModernIconProvider.create_pause_icon(),
-        'stop': ModernIconProvider.create_stop_icon(),
-        'add': ModernIconProvider.create_add_icon(),
-        'settings': ModernIconProvider.create_settings_icon(),
-        'folder': ModernIconProvider.create_folder_icon(),
-        'file': ModernIconProvider.create_file_icon(),
-        'audio': ModernIconProvider.create_audio_icon(),
-        'video': ModernIconProvider.create_video_icon(),
-        'waveform': ModernIconProvider.create_waveform_icon(),
-        'success': ModernIconProvider.create_success_icon(),
-        'error': ModernIconProvider.create_error_icon(),
-        'warning': ModernIconProvider.create_warning_icon(),
-        'info': ModernIconProvider.create_info_icon(),
-        'delete': ModernIconProvider.create_delete_icon(),
-        'clear': ModernIconProvider.create_clear_icon(),
-        'minimize': ModernIconProvider.create_minimize_icon(),
-        'maximize': ModernIconProvider.create_maximize_icon(),
-        'close': ModernIconProvider.create_close_icon(),
-        'download': ModernIconProvider.create_download_icon(),
-        'upload': ModernIconProvider.create_upload_icon(),
-    }
\ No newline at end of file
+    """Get a mapping of all available modern icons, created lazily."""
+    return ICONS
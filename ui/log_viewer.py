@@ -1,23 +1,94 @@
 """Log viewer widget for displaying application logs."""
 
+import codecs
+import mmap
+import os
 import re
+from collections import deque
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QComboBox, QLabel, QCheckBox, QGroupBox, QFileDialog,
     QMessageBox, QLineEdit
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QFileSystemWatcher
-from PySide6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QFileSystemWatcher, QUrl, QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QColor, QTextCharFormat, QSyntaxHighlighter, QDesktopServices
 
 from utils.logging_setup import get_logger
 
 logger = get_logger("log_viewer")
 
 
+def _make_fmt(color: QColor, bold: bool = False) -> QTextCharFormat:
+    """Build a character format for a log level."""
+    format = QTextCharFormat()
+    format.setForeground(color)
+    if bold:
+        format.setFontWeight(QFont.Bold)
+    return format
+
+
+class LogHighlighter(QSyntaxHighlighter):
+    """Colours log lines by level as they are laid out."""
+    
+    # First level name in a line, matched in a single pass
+    LEVEL_RE = re.compile(r' (DEBUG|INFO|WARNING|ERROR|CRITICAL) ')
+    
+    # Formats shared by every highlighter
+    _FMT_DEBUG = _make_fmt(QColor(128, 128, 128))  # Gray
+    _FMT_INFO = _make_fmt(QColor(0, 0, 0))  # Black
+    _FMT_WARNING = _make_fmt(QColor(255, 140, 0))  # Orange
+    _FMT_ERROR = _make_fmt(QColor(255, 0, 0))  # Red
+    _FMT_CRITICAL = _make_fmt(QColor(255, 0, 0), bold=True)  # Bold red
+    
+    _FMT_TABLE = {
+        "DEBUG": _FMT_DEBUG,
+        "INFO": _FMT_INFO,
+        "WARNING": _FMT_WARNING,
+        "ERROR": _FMT_ERROR,
+        "CRITICAL": _FMT_CRITICAL,
+    }
+    
+    def highlightBlock(self, text: str) -> None:
+        """Format one line by its log level."""
+        match = self.LEVEL_RE.search(text)
+        if match:
+            self.setFormat(0, len(text), self._FMT_TABLE[match.group(1)])
+
+
+class _SaveSignals(QObject):
+    """Signals reporting the outcome of a background log save."""
+    finished = Signal(str)  # filename
+    failed = Signal(str, str)  # filename, error
+
+
+class _LogSaveTask(QRunnable):
+    """Writes log text to a file on a thread pool thread."""
+    
+    def __init__(self, filename: str, text: str):
+        super().__init__()
+        self.filename = filename
+        self.text = text
+        # Owned by the task so emitting stays safe if the viewer is destroyed
+        self.signals = _SaveSignals()
+    
+    def run(self) -> None:
+        """Write the file and report the result."""
+        try:
+            with open(self.filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(self.text)
+        except Exception as e:
+            self.signals.failed.emit(self.filename, str(e))
+            return
+        
+        self.signals.finished.emit(self.filename)
+
+
 class LogViewer(QWidget):
     """Widget for viewing and filtering application logs."""
     
@@ -26,20 +97,32 @@ class LogViewer(QWidget):
         
         self.log_file_path: Optional[Path] = None
         self.last_position = 0
+        
+        # Persistent handle for tailing, reopened only when the log rotates
+        self._log_file = None
+        self._decoder = None
         self.max_lines = 1000
         self.auto_scroll = True
         
+        # Raw log lines with their lowercase form for searching, the source
+        # for every filtered re-render
+        self._raw_lines = deque(maxlen=self.max_lines)
+        self._partial_line = ""
+        
         # File watcher for real-time updates
         self.file_watcher = QFileSystemWatcher()
         self.file_watcher.fileChanged.connect(self._on_file_changed)
+        self.file_watcher.directoryChanged.connect(self._on_directory_changed)
         
         self._setup_ui()
         self._setup_log_monitoring()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_logs)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        # Updates are driven by the file watcher; a burst of change
+        # notifications is coalesced into a single read
+        self._pending_update = QTimer(self)
+        self._pending_update.setSingleShot(True)
+        self._pending_update.setInterval(200)
+        self._pending_update.timeout.connect(self._update_logs)
         
         logger.debug("Log viewer initialized")
     
@@ -77,9 +160,15 @@ class LogViewer(QWidget):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Filter log messages...")
-        self.search_input.textChanged.connect(self._apply_filters)
+        self.search_input.textChanged.connect(self._schedule_filters)
         filter_layout.addWidget(self.search_input)
         
+        # Coalesce typing into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filters)
+        
         filter_layout.addStretch()
         controls_layout.addLayout(filter_layout)
         
@@ -124,10 +213,12 @@ class LogViewer(QWidget):
         layout.addWidget(controls_group)
         
         # Log display
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
-        self.log_text.setLineWrapMode(QTextEdit.WidgetWidth)
+        self.log_text.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        self.log_text.setMaximumBlockCount(self.max_lines)
+        self._highlighter = LogHighlighter(self.log_text.document())
         layout.addWidget(self.log_text)
         
         # Status
@@ -137,23 +228,32 @@ class LogViewer(QWidget):
     
     def _setup_log_monitoring(self) -> None:
         """Set up log file monitoring."""
-        # Find the current log file
-        logs_dir = Path("logs")
-        if logs_dir.exists():
-            today = datetime.now().strftime("%Y%m%d")
-            log_pattern = f"noise_cancellation-{today}.log"
-            
-            for log_file in logs_dir.glob("noise_cancellation-*.log"):
-                if log_file.name.startswith(f"noise_cancellation-{today}"):
-                    self.log_file_path = log_file
-                    break
-            else:
-                # Use the most recent log file
-                log_files = list(logs_dir.glob("noise_cancellation-*.log"))
-                if log_files:
-                    self.log_file_path = max(log_files, key=lambda f: f.stat().st_mtime)
+        # Find the current log file: today's, else the most recent one, in a
+        # single directory pass
+        today_prefix = f"noise_cancellation-{datetime.now().strftime('%Y%m%d')}"
+        latest_path = None
+        latest_mtime = None
+        try:
+            with os.scandir("logs") as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith("noise_cancellation-") and name.endswith(".log")):
+                        continue
+                    
+                    if name.startswith(today_prefix):
+                        latest_path = entry.path
+                        break
+                    
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_path, latest_mtime = entry.path, mtime
+        except OSError:
+            pass  # No logs folder yet
         
-        if self.log_file_path and self.log_file_path.exists():
+        if latest_path is not None:
+            self.log_file_path = Path(latest_path)
+        
+        if self.log_file_path:
             self.file_watcher.addPath(str(self.log_file_path))
             self.status_label.setText(f"Monitoring: {self.log_file_path.name}")
             self._load_initial_logs()
@@ -162,154 +262,201 @@ class LogViewer(QWidget):
     
     def _load_initial_logs(self) -> None:
         """Load initial log content."""
-        if not self.log_file_path or not self.log_file_path.exists():
+        if not self.log_file_path:
             return
         
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-                # Keep only the last max_lines
-                if len(lines) > self.max_lines:
-                    lines = lines[-self.max_lines:]
-                
-                content = ''.join(lines)
-                self.log_text.setPlainText(content)
-                self.last_position = self.log_file_path.stat().st_size
-                
-                if self.auto_scroll:
-                    self._scroll_to_bottom()
-                
-                self._apply_filters()
-                
+            path_stat = self._open_log_file()
+            if path_stat is None:
+                return
+            
+            size = path_stat.st_size
+            self._decoder.reset()
+            
+            self._raw_lines.clear()
+            self._partial_line = ""
+            self._ingest(self._read_tail(size))
+            self.last_position = size
+            
+            self._apply_filters()
+            
+            if self.auto_scroll:
+                self._scroll_to_bottom()
+            
         except Exception as e:
             logger.error(f"Error loading initial logs: {e}")
             self.status_label.setText("Error loading logs")
     
+    def _read_tail(self, size: int) -> str:
+        """Read the last max_lines lines of the first size bytes of the log.
+        
+        Reads backwards in growing chunks rather than loading the whole file.
+        """
+        if size == 0:
+            return ""
+        
+        # Start from an estimate of 256 bytes per line, doubling as needed
+        chunk = 256 * self.max_lines
+        while True:
+            start = max(0, size - chunk)
+            data = self._read_range(start, size)
+            if start == 0 or data.count(b'\n') > self.max_lines:
+                break
+            chunk *= 2
+        
+        lines = data.split(b'\n')
+        if start > 0:
+            lines = lines[1:]  # First line is probably cut
+        
+        # Last max_lines complete lines plus whatever follows the last newline
+        return b'\n'.join(lines[-(self.max_lines + 1):]).decode('utf-8', errors='replace')
+    
     def _on_file_changed(self, path: str) -> None:
         """Handle log file changes."""
-        # Schedule update on next timer cycle to avoid rapid updates
-        if not self.update_timer.isActive():
-            self.update_timer.start(500)
+        # Some platforms stop watching a file once it is replaced
+        if path not in self.file_watcher.files():
+            if Path(path).exists():
+                self.file_watcher.addPath(path)
+            else:
+                # Rotated away; watch the folder until the new file appears
+                self.file_watcher.addPath(str(Path(path).parent))
+        
+        self._pending_update.start()
+    
+    def _on_directory_changed(self, path: str) -> None:
+        """Resume watching the log file once it is recreated after rotation."""
+        if self.log_file_path and self.log_file_path.exists():
+            self.file_watcher.removePath(path)
+            self.file_watcher.addPath(str(self.log_file_path))
+            self._pending_update.start()
+    
+    def _open_log_file(self) -> Optional[os.stat_result]:
+        """Make sure the tail handle is open on the current log file.
+        
+        Returns:
+            The log file's stat result, or None if it can't be read
+        """
+        try:
+            path_stat = self.log_file_path.stat()
+        except OSError:
+            return None
+        
+        if self._log_file is not None:
+            if os.fstat(self._log_file.fileno()).st_ino == path_stat.st_ino:
+                return path_stat
+            
+            # Log was rotated; start over on the new file
+            self._close_log_file()
+            self.last_position = 0
+        
+        self._log_file = open(self.log_file_path, 'rb')
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        # The watcher drops a file that is replaced, so re-arm it on reopen
+        if str(self.log_file_path) not in self.file_watcher.files():
+            self.file_watcher.addPath(str(self.log_file_path))
+        return path_stat
+    
+    def _read_range(self, start: int, end: int) -> bytes:
+        """Read bytes [start, end) of the log through a memory map of the tail."""
+        # Map offsets must be aligned to the allocation granularity
+        offset = start - start % mmap.ALLOCATIONGRANULARITY
+        with mmap.mmap(self._log_file.fileno(), end - offset,
+                       access=mmap.ACCESS_READ, offset=offset) as mapped:
+            return mapped[start - offset:]
+    
+    def _close_log_file(self) -> None:
+        """Close the tail handle."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+            self._decoder = None
     
     def _update_logs(self) -> None:
         """Update logs with new content."""
-        if not self.log_file_path or not self.log_file_path.exists():
+        if not self.log_file_path:
             return
         
         try:
-            current_size = self.log_file_path.stat().st_size
+            path_stat = self._open_log_file()
+            if path_stat is None:
+                return
             
+            current_size = path_stat.st_size
             if current_size <= self.last_position:
                 return  # No new content
             
-            # Read new content
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                f.seek(self.last_position)
-                new_content = f.read()
-                
-                if new_content.strip():
-                    # Append new content
-                    cursor = self.log_text.textCursor()
-                    cursor.movePosition(QTextCursor.End)
-                    cursor.insertText(new_content)
-                    
-                    # Limit total lines
-                    self._limit_text_lines()
-                    
-                    if self.auto_scroll:
-                        self._scroll_to_bottom()
-                    
-                    self._apply_filters()
-                
-                self.last_position = current_size
-                
+            # Read only the appended bytes; the incremental decoder keeps
+            # multi-byte characters split across reads intact
+            new_content = self._decoder.decode(
+                self._read_range(self.last_position, current_size)
+            )
+            
+            # Always ingest, even whitespace, so a held-back partial line
+            # is completed by the newline that ends it
+            entries = self._ingest(new_content)
+            if entries:
+                self._append_lines(entries)
+            
+            self.last_position = current_size
+            
         except Exception as e:
             logger.error(f"Error updating logs: {e}")
     
-    def _limit_text_lines(self) -> None:
-        """Limit text to maximum number of lines."""
-        document = self.log_text.document()
-        
-        if document.blockCount() > self.max_lines:
-            cursor = QTextCursor(document)
-            cursor.movePosition(QTextCursor.Start)
-            
-            # Select excess lines
-            lines_to_remove = document.blockCount() - self.max_lines
-            for _ in range(lines_to_remove):
-                cursor.movePosition(QTextCursor.EndOfBlock)
-                cursor.movePosition(QTextCursor.NextBlock)
+    def _ingest(self, content: str) -> List[Tuple[str, str]]:
+        """Add new log content to the raw line buffer; returns the new entries."""
+        lines = (self._partial_line + content).split('\n')
+        
+        # Hold back an unterminated last line until the rest of it arrives
+        self._partial_line = lines.pop()
+        entries = [(line, line.lower()) for line in lines]
+        self._raw_lines.extend(entries)
+        return entries
+    
+    def _append_lines(self, entries: List[Tuple[str, str]]) -> None:
+        """Append newly read lines that pass the current filters."""
+        lines = self._filter_lines(entries)
+        if lines:
+            self.log_text.appendPlainText('\n'.join(lines))
             
-            cursor.select(QTextCursor.BlockUnderCursor)
-            cursor.removeSelectedText()
+            if self.auto_scroll:
+                self._scroll_to_bottom()
     
-    def _apply_filters(self) -> None:
-        """Apply level and search filters to log display."""
-        if not self.log_text.toPlainText():
-            return
-        
+    def _schedule_filters(self) -> None:
+        """Re-filter shortly after the search text stops changing."""
+        self._filter_timer.start()
+    
+    def _filter_lines(self, entries) -> List[str]:
+        """Get the lines that pass the level and search filters."""
         level_filter = self.level_combo.currentData()
         search_filter = self.search_input.text().lower()
         
-        # Get all text
-        full_text = self.log_text.toPlainText()
-        lines = full_text.split('\n')
-        
-        # Apply filters
-        filtered_lines = []
-        for line in lines:
-            # Level filter
-            if level_filter and level_filter not in line:
-                continue
-            
-            # Search filter
-            if search_filter and search_filter not in line.lower():
-                continue
-            
-            filtered_lines.append(line)
+        if not level_filter and not search_filter:
+            return [line for line, _ in entries]
         
+        return [
+            line for line, lowered in entries
+            if (not level_filter or level_filter in line)
+            and (not search_filter or search_filter in lowered)
+        ]
+    
+    def _apply_filters(self) -> None:
+        """Apply level and search filters to log display."""
         # Update display with syntax highlighting
-        self._display_filtered_lines(filtered_lines)
+        self._display_filtered_lines(self._filter_lines(self._raw_lines))
     
     def _display_filtered_lines(self, lines: List[str]) -> None:
         """Display filtered lines with syntax highlighting."""
         # Store cursor position
         was_at_end = self.log_text.textCursor().atEnd()
         
-        # Clear and set new content
-        self.log_text.clear()
-        
-        for line in lines:
-            self._append_formatted_line(line)
+        # Replace the content in one call; the highlighter colours lines
+        self.log_text.setPlainText('\n'.join(lines))
         
         # Restore scroll position
         if was_at_end and self.auto_scroll:
             self._scroll_to_bottom()
     
-    def _append_formatted_line(self, line: str) -> None:
-        """Append a line with appropriate formatting."""
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        
-        # Create format based on log level
-        format = QTextCharFormat()
-        
-        if " DEBUG " in line:
-            format.setForeground(QColor(128, 128, 128))  # Gray
-        elif " INFO " in line:
-            format.setForeground(QColor(0, 0, 0))  # Black
-        elif " WARNING " in line:
-            format.setForeground(QColor(255, 140, 0))  # Orange
-        elif " ERROR " in line:
-            format.setForeground(QColor(255, 0, 0))  # Red
-        elif " CRITICAL " in line:
-            format.setForeground(QColor(255, 0, 0))  # Red
-            format.setFontWeight(QFont.Bold)
-        
-        cursor.setCharFormat(format)
-        cursor.insertText(line + '\n')
-    
     def _scroll_to_bottom(self) -> None:
         """Scroll to the bottom of the log display."""
         scrollbar = self.log_text.verticalScrollBar()
@@ -324,9 +471,9 @@ class LogViewer(QWidget):
     def _toggle_word_wrap(self, enabled: bool) -> None:
         """Toggle word wrap in log display."""
         if enabled:
-            self.log_text.setLineWrapMode(QTextEdit.WidgetWidth)
+            self.log_text.setLineWrapMode(QPlainTextEdit.WidgetWidth)
         else:
-            self.log_text.setLineWrapMode(QTextEdit.NoWrap)
+            self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
     
     def _clear_logs(self) -> None:
         """Clear the log display."""
@@ -340,6 +487,7 @@ class LogViewer(QWidget):
         
         if reply == QMessageBox.Yes:
             self.log_text.clear()
+            self._raw_lines.clear()
             logger.info("Log viewer cleared")
     
     def _refresh_logs(self) -> None:
@@ -359,24 +507,29 @@ class LogViewer(QWidget):
         )
         
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.log_text.toPlainText())
-                
-                QMessageBox.information(
-                    self,
-                    "Logs Saved",
-                    f"Logs saved to:\n{filename}"
-                )
-                logger.info(f"Logs saved to {filename}")
-                
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Save Error",
-                    f"Failed to save logs:\n{str(e)}"
-                )
-                logger.error(f"Failed to save logs: {e}")
+            # Copy the text here; the write happens on a pool thread
+            task = _LogSaveTask(filename, self.log_text.toPlainText())
+            task.signals.finished.connect(self._on_logs_saved)
+            task.signals.failed.connect(self._on_save_failed)
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_logs_saved(self, filename: str) -> None:
+        """Handle a finished background save."""
+        QMessageBox.information(
+            self,
+            "Logs Saved",
+            f"Logs saved to:\n{filename}"
+        )
+        logger.info(f"Logs saved to {filename}")
+    
+    def _on_save_failed(self, filename: str, error: str) -> None:
+        """Handle a failed background save."""
+        QMessageBox.critical(
+            self,
+            "Save Error",
+            f"Failed to save logs:\n{error}"
+        )
+        logger.error(f"Failed to save logs: {error}")
     
     def _open_logs_folder(self) -> None:
         """Open the logs folder in system file explorer."""
@@ -384,22 +537,11 @@ class LogViewer(QWidget):
         if not logs_dir.exists():
             logs_dir.mkdir(exist_ok=True)
         
-        try:
-            import subprocess
-            import platform
-            
-            system = platform.system()
-            if system == "Windows":
-                subprocess.run(["explorer", str(logs_dir)])
-            elif system == "Darwin":  # macOS
-                subprocess.run(["open", str(logs_dir)])
-            else:  # Linux
-                subprocess.run(["xdg-open", str(logs_dir)])
-                
+        # Hands off to the desktop shell without blocking the event loop
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(str(logs_dir.absolute()))):
             logger.info("Opened logs folder")
-            
-        except Exception as e:
-            logger.error(f"Failed to open logs folder: {e}")
+        else:
+            logger.error("Failed to open logs folder")
             QMessageBox.information(
                 self,
                 "Logs Folder",
@@ -411,9 +553,11 @@ class LogViewer(QWidget):
         # Stop file watching
         if self.file_watcher:
             self.file_watcher.removePaths(self.file_watcher.files())
+            self.file_watcher.removePaths(self.file_watcher.directories())
         
         # Stop timer
-        if self.update_timer:
-            self.update_timer.stop()
+        self._pending_update.stop()
+        
+        self._close_log_file()
         
         event.accept()
\ No newline at end of file
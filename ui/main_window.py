@@ -1,6 +1,8 @@
 """Main application window with tabbed interface."""
 
 import json
+import os
+from functools import partial
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -8,9 +10,12 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QTabWidget, QMenuBar, QStatusBar, QProgressBar, QLabel,
     QMessageBox, QFileDialog, QApplication, QFrame, QGroupBox,
-    QGraphicsDropShadowEffect, QPushButton, QToolButton
+    QGraphicsDropShadowEffect, QGraphicsOpacityEffect, QPushButton, QToolButton
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, Slot, QSettings, QSize, QPropertyAnimation, QEasingCurve, QRect, QPoint,
+    QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QSettings, QSize, QPropertyAnimation, QEasingCurve, QRect, QPoint
 from PySide6.QtGui import QAction, QKeySequence, QIcon, QDragEnterEvent, QDropEvent, QLinearGradient, QPalette, QColor
 
 from ui.file_list import FileListWidget
@@ -20,12 +25,91 @@ from ui.batch_processor import BatchProcessorWidget
 from ui.preferences_dialog import PreferencesDialog
 from ui.log_viewer import LogViewer
 from ui.modern_styles import apply_modern_style
+from ui.icon_provider import ModernIconProvider
 from utils.logging_setup import get_logger
-from utils.paths import is_media_file
+from utils.paths import MEDIA_EXTENSIONS
 from core.pipeline import ProcessingJob, Engine
 
 logger = get_logger("main_window")
 
+# Menu shortcuts, parsed once per process
+_KS_ADD_FOLDER = QKeySequence("Ctrl+Shift+O")
+_KS_CLEAR_LIST = QKeySequence("Ctrl+Shift+C")
+_KS_START_BATCH = QKeySequence("Ctrl+Return")
+_KS_PAUSE_BATCH = QKeySequence("Ctrl+P")
+_KS_STOP_BATCH = QKeySequence("Ctrl+S")
+_KS_SHOW_SETTINGS = QKeySequence("Ctrl+1")
+_KS_SHOW_PREVIEW = QKeySequence("Ctrl+2")
+_KS_SHOW_LOGS = QKeySequence("Ctrl+3")
+
+
+def _scan_media_files(folder: Path) -> List[Path]:
+    """Collect media files under a folder in a single directory walk."""
+    media_files = []
+    pending = [str(folder)]
+    
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTENSIONS and entry.is_file():
+                        media_files.append(Path(entry.path))
+        except OSError as e:
+            logger.warning(f"Could not scan {directory}: {e}")
+    
+    return media_files
+
+
+# Paths already confirmed as existing media files. Failures are never
+# cached, so a file that appears later (e.g. a finished export) is accepted.
+_VALIDATED_PATHS_MAX = 8192
+_validated_paths = set()
+
+
+def _validate_path(path: str) -> bool:
+    """Check that a path is an existing media file, remembering successes."""
+    if path in _validated_paths:
+        return True
+    
+    if os.path.splitext(path)[1].lower() not in MEDIA_EXTENSIONS or not os.path.exists(path):
+        return False
+    
+    if len(_validated_paths) >= _VALIDATED_PATHS_MAX:
+        _validated_paths.clear()
+    _validated_paths.add(path)
+    return True
+
+
+class _ScanSignals(QObject):
+    """Signals reporting the result of a background file scan."""
+    finished = Signal(list, int, str)  # valid files, skipped count, scanned folder
+
+
+class _ScanTask(QRunnable):
+    """Scans a folder or validates dropped files on a thread pool thread."""
+    
+    def __init__(self, files: Optional[List[Path]] = None, folder: Optional[Path] = None):
+        super().__init__()
+        # Owned by the task rather than the window, so emitting stays safe
+        # if the window is destroyed while the scan is still running
+        self.signals = _ScanSignals()
+        self.files = files or []
+        self.folder = folder
+    
+    def run(self) -> None:
+        """Collect the valid files and report them."""
+        if self.folder is not None:
+            valid_files = _scan_media_files(self.folder)
+            skipped = 0
+        else:
+            valid_files = [f for f in self.files if _validate_path(str(f))]
+            skipped = len(self.files) - len(valid_files)
+        
+        self.signals.finished.emit(valid_files, skipped, str(self.folder or ""))
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -35,6 +119,14 @@ class MainWindow(QMainWindow):
     processing_started = Signal()
     processing_stopped = Signal()
     
+    # Name filter for the add files dialog
+    MEDIA_FILE_FILTER = (
+        "Media Files (*.wav *.mp3 *.flac *.aac *.ogg *.m4a *.mp4 *.avi *.mkv *.mov *.wmv *.webm);;"
+        "Audio Files (*.wav *.mp3 *.flac *.aac *.ogg *.m4a);;"
+        "Video Files (*.mp4 *.avi *.mkv *.mov *.wmv *.webm);;"
+        "All Files (*.*)"
+    )
+    
     def __init__(self, config_dir: Path = Path("config"), initial_files: Optional[List[Path]] = None):
         """
         Initialize main window.
@@ -66,7 +158,7 @@ class MainWindow(QMainWindow):
         
         # Load initial files if provided
         if initial_files:
-            QTimer.singleShot(100, lambda: self._add_files(initial_files))
+            QTimer.singleShot(0, partial(self._add_files, initial_files))
         
         logger.info("Main window initialized")
     
@@ -81,8 +173,13 @@ class MainWindow(QMainWindow):
         # Create settings panel
         self.settings_panel = SettingsPanel()
         
-        # Create preview panel
-        self.preview_panel = PreviewPanel()
+        # Preview panel is built the first time its tab is shown
+        self.preview_panel: Optional[PreviewPanel] = None
+        self._preview_placeholder = QWidget()
+        self._pending_preview_file: Optional[Path] = None
+        
+        # Directory the file dialogs reopen in
+        self._last_dialog_dir = ""
         
         # Create log viewer
         self.log_viewer = LogViewer()
@@ -136,6 +233,7 @@ class MainWindow(QMainWindow):
     def _create_header(self) -> QWidget:
         """Create compact header with title and quick actions."""
         header = QFrame()
+        header.setObjectName("appHeader")
         header.setProperty("class", "glass-card")
         header.setMaximumHeight(40)
         header.setMinimumHeight(40)
@@ -145,17 +243,9 @@ class MainWindow(QMainWindow):
         layout.setSpacing(8)
         
         # App title - compact
-        title = QLabel("🎵 Noise Cancellation Studio")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: white;
-                margin: 0;
-                padding: 0;
-            }
-        """)
-        layout.addWidget(title)
+        title = QLabel("Noise Cancellation Studio")
+        title.setObjectName("appTitle")
+        layout.addWidget(self._with_emoji("🎵", title, 16))
         
         layout.addStretch()
         
@@ -168,24 +258,26 @@ class MainWindow(QMainWindow):
         
         process_btn = QPushButton("▶ Process")
         process_btn.setFixedSize(70, 26)
-        process_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #57f287, stop:1 #3ba55d);
-                padding: 4px 8px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #67f297, stop:1 #4bb56d);
-            }
-        """)
+        process_btn.setObjectName("headerProcessButton")
         process_btn.clicked.connect(self._start_processing)
         layout.addWidget(process_btn)
         
         return header
     
+    def _with_emoji(self, emoji: str, label: QLabel, size: int) -> QWidget:
+        """Place a cached emoji pixmap in front of a label."""
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+        
+        icon = QLabel()
+        icon.setPixmap(ModernIconProvider.create_emoji_pixmap(emoji, size))
+        layout.addWidget(icon)
+        layout.addWidget(label)
+        
+        return container
+    
     def _create_left_panel(self) -> QWidget:
         """Create the left panel with file list and batch controls."""
         panel = QFrame()
@@ -196,51 +288,16 @@ class MainWindow(QMainWindow):
         layout.setSpacing(6)
         
         # Section title - compact
-        files_title = QLabel("📁 File Queue")
-        files_title.setStyleSheet("""
-            QLabel {
-                font-size: 12px;
-                font-weight: 600;
-                color: #a0a8b7;
-                margin: 2px 0;
-                padding: 0;
-            }
-        """)
-        layout.addWidget(files_title)
+        files_title = QLabel("File Queue")
+        files_title.setObjectName("fileQueueTitle")
+        layout.addWidget(self._with_emoji("📁", files_title, 14))
         
         # File list widget with compact styling
-        self.file_list.setStyleSheet("""
-            QListWidget {
-                background: rgba(10, 15, 30, 0.4);
-                border: 1px solid rgba(88, 101, 242, 0.2);
-                border-radius: 6px;
-                padding: 6px;
-            }
-            QListWidget::item {
-                padding: 6px;
-                margin: 1px 0;
-                background: rgba(255, 255, 255, 0.03);
-                border-radius: 3px;
-                min-height: 14px;
-                font-size: 12px;
-            }
-            QListWidget::item:hover {
-                background: rgba(88, 101, 242, 0.15);
-            }
-            QListWidget::item:selected {
-                background: rgba(88, 101, 242, 0.3);
-            }
-        """)
+        self.file_list.setObjectName("fileQueue")
         layout.addWidget(self.file_list)
         
         # Batch processor controls with compact styling
-        self.batch_processor.setStyleSheet("""
-            QWidget {
-                background: rgba(88, 101, 242, 0.08);
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        self.batch_processor.setObjectName("batchPanel")
         layout.addWidget(self.batch_processor)
         
         return panel
@@ -256,83 +313,70 @@ class MainWindow(QMainWindow):
         
         # Create tab widget with modern styling
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                background: rgba(20, 25, 40, 0.6);
-                border: 2px solid rgba(88, 101, 242, 0.2);
-                border-radius: 8px;
-                padding: 4px;
-            }
-            QTabBar::tab {
-                padding: 6px 12px;
-                margin: 0 1px;
-                font-size: 12px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
         
         # Settings tab with icon (already created)
         self.tab_widget.addTab(self.settings_panel, "⚙️ Settings")
         
-        # Preview tab with icon (already created)
-        self.tab_widget.addTab(self.preview_panel, "👁️ Preview")
+        # Preview tab holds a placeholder until first shown
+        self.tab_widget.addTab(self._preview_placeholder, "👁️ Preview")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         layout.addWidget(self.tab_widget, stretch=2)  # Reduce tab space
         
         # Log viewer with expanded styling for better readability
         logs_group = QGroupBox("📋 Processing Logs")
+        logs_group.setObjectName("logsGroup")
         logs_group.setMinimumHeight(150)
-        logs_group.setStyleSheet("""
-            QGroupBox {
-                background: rgba(10, 15, 30, 0.4);
-                border: 2px solid rgba(88, 101, 242, 0.2);
-                border-radius: 8px;
-                padding-top: 16px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QGroupBox::title {
-                color: #a0a8b7;
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         logs_layout = QVBoxLayout(logs_group)
         logs_layout.setContentsMargins(8, 8, 8, 8)
         logs_layout.setSpacing(4)
         
         # Log viewer with expanded styling for better readability
+        self.log_viewer.setObjectName("logViewer")
         self.log_viewer.setMinimumHeight(120)
-        self.log_viewer.setStyleSheet("""
-            QTextEdit {
-                background: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(88, 101, 242, 0.15);
-                border-radius: 6px;
-                padding: 8px;
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 11px;
-                line-height: 1.3;
-                color: #e4e7eb;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.05);
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(88, 101, 242, 0.5);
-                min-height: 20px;
-                border-radius: 6px;
-            }
-        """)
         logs_layout.addWidget(self.log_viewer)
         
         layout.addWidget(logs_group, stretch=2)  # More space for logs
         
         return right_panel
     
+    @Slot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Build the preview panel when its tab is first shown."""
+        if self.tab_widget.widget(index) is self._preview_placeholder:
+            self._ensure_preview_panel()
+    
+    def _ensure_preview_panel(self) -> PreviewPanel:
+        """Create the preview panel and swap it in for the placeholder."""
+        if self.preview_panel is not None:
+            return self.preview_panel
+        
+        self.preview_panel = PreviewPanel()
+        self.tab_widget.currentChanged.disconnect(self._on_tab_changed)
+        
+        index = self.tab_widget.indexOf(self._preview_placeholder)
+        was_current = self.tab_widget.currentIndex() == index
+        text = self.tab_widget.tabText(index)
+        
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, self.preview_panel, text)
+        if was_current:
+            self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        
+        self._preview_placeholder.deleteLater()
+        self._preview_placeholder = None
+        
+        # Load the selection made before the panel existed
+        if self._pending_preview_file:
+            self.preview_panel.load_file(self._pending_preview_file)
+            self._pending_preview_file = None
+        
+        return self.preview_panel
+    
+    @Slot()
     def _start_processing(self) -> None:
         """Start processing with error handling."""
         try:
@@ -368,7 +412,7 @@ class MainWindow(QMainWindow):
         file_menu.addAction(add_files_action)
         
         add_folder_action = QAction("Add &Folder...", self)
-        add_folder_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        add_folder_action.setShortcut(_KS_ADD_FOLDER)
         add_folder_action.setStatusTip("Add all media files from a folder")
         add_folder_action.triggered.connect(self._add_folder_dialog)
         file_menu.addAction(add_folder_action)
@@ -376,7 +420,7 @@ class MainWindow(QMainWindow):
         file_menu.addSeparator()
         
         clear_list_action = QAction("&Clear List", self)
-        clear_list_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
+        clear_list_action.setShortcut(_KS_CLEAR_LIST)
         clear_list_action.setStatusTip("Clear all files from the list")
         clear_list_action.triggered.connect(self.file_list.clear)
         file_menu.addAction(clear_list_action)
@@ -401,19 +445,19 @@ class MainWindow(QMainWindow):
         process_menu = menubar.addMenu("&Processing")
         
         start_batch_action = QAction("&Start Batch Processing", self)
-        start_batch_action.setShortcut(QKeySequence("Ctrl+Return"))
+        start_batch_action.setShortcut(_KS_START_BATCH)
         start_batch_action.setStatusTip("Start processing all files in the queue")
         start_batch_action.triggered.connect(self.batch_processor.start_processing)
         process_menu.addAction(start_batch_action)
         
         pause_batch_action = QAction("&Pause Processing", self)
-        pause_batch_action.setShortcut(QKeySequence("Ctrl+P"))
+        pause_batch_action.setShortcut(_KS_PAUSE_BATCH)
         pause_batch_action.setStatusTip("Pause batch processing")
         pause_batch_action.triggered.connect(self.batch_processor.pause_processing)
         process_menu.addAction(pause_batch_action)
         
         stop_batch_action = QAction("&Stop Processing", self)
-        stop_batch_action.setShortcut(QKeySequence("Ctrl+S"))
+        stop_batch_action.setShortcut(_KS_STOP_BATCH)
         stop_batch_action.setStatusTip("Stop batch processing")
         stop_batch_action.triggered.connect(self.batch_processor.stop_processing)
         process_menu.addAction(stop_batch_action)
@@ -430,18 +474,18 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("&View")
         
         show_settings_action = QAction("&Settings Panel", self)
-        show_settings_action.setShortcut(QKeySequence("Ctrl+1"))
-        show_settings_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(0))
+        show_settings_action.setShortcut(_KS_SHOW_SETTINGS)
+        show_settings_action.triggered.connect(self._show_tab_settings)
         view_menu.addAction(show_settings_action)
         
         show_preview_action = QAction("&Preview Panel", self)
-        show_preview_action.setShortcut(QKeySequence("Ctrl+2"))
-        show_preview_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(1))
+        show_preview_action.setShortcut(_KS_SHOW_PREVIEW)
+        show_preview_action.triggered.connect(self._show_tab_preview)
         view_menu.addAction(show_preview_action)
         
         show_logs_action = QAction("&Log Panel", self)
-        show_logs_action.setShortcut(QKeySequence("Ctrl+3"))
-        show_logs_action.triggered.connect(lambda: self.log_viewer.setFocus())
+        show_logs_action.setShortcut(_KS_SHOW_LOGS)
+        show_logs_action.triggered.connect(self._focus_logs)
         view_menu.addAction(show_logs_action)
         
         # Help menu
@@ -461,21 +505,30 @@ class MainWindow(QMainWindow):
         self.pause_batch_action.setEnabled(False)
         self.stop_batch_action.setEnabled(False)
     
+    @Slot()
+    def _show_tab_settings(self) -> None:
+        """Switch to the settings tab."""
+        self.tab_widget.setCurrentIndex(0)
+    
+    @Slot()
+    def _show_tab_preview(self) -> None:
+        """Switch to the preview tab."""
+        self.tab_widget.setCurrentIndex(1)
+    
+    @Slot()
+    def _focus_logs(self) -> None:
+        """Move keyboard focus to the log viewer."""
+        self.log_viewer.setFocus()
+    
     def _setup_status_bar(self) -> None:
         """Set up the status bar."""
         self.status_bar = self.statusBar()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background: rgba(15, 20, 35, 0.9);
-                border-top: 1px solid rgba(88, 101, 242, 0.2);
-                padding: 4px;
-                max-height: 28px;
-            }
-        """)
+        self.status_bar.setObjectName("appStatusBar")
         
         # Main status label with icon
         self.status_label = QLabel("✅ Ready")
-        self.status_label.setStyleSheet("font-size: 12px; color: #57f287; padding: 4px;")
+        self.status_label.setObjectName("statusLabel")
+        self._set_status_state("ready")
         self.status_bar.addWidget(self.status_label, 1)
         
         # Compact progress bar
@@ -483,26 +536,46 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.progress_bar.setMaximumWidth(200)
         self.progress_bar.setFixedHeight(16)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                height: 16px;
-                text-align: center;
-                font-size: 11px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4752c4, stop:0.5 #5865f2, stop:1 #6574ff);
-                border-radius: 8px;
-            }
-        """)
+        self.progress_bar.setObjectName("statusProgress")
         self.status_bar.addPermanentWidget(self.progress_bar)
         
+        # Pulse the progress bar through an opacity effect while processing
+        self.progress_effect = QGraphicsOpacityEffect(self.progress_bar)
+        self.progress_effect.setEnabled(False)
+        self.progress_bar.setGraphicsEffect(self.progress_effect)
+        
+        self.progress_animation = QPropertyAnimation(self.progress_effect, b"opacity", self)
+        self.progress_animation.setDuration(1000)
+        self.progress_animation.setLoopCount(-1)  # Infinite loop
+        self.progress_animation.setStartValue(1.0)
+        self.progress_animation.setKeyValueAt(0.5, 0.7)
+        self.progress_animation.setEndValue(1.0)
+        
+        # Coalesce progress updates to roughly 30 Hz
+        self._pending_progress: Optional[tuple] = None
+        self._shown_progress: Optional[tuple] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         # File count label with icon
-        self.file_count_label = QLabel("📄 0 files")
-        self.file_count_label.setStyleSheet("font-size: 12px; color: #a0a8b7; padding: 4px;")
-        self.status_bar.addPermanentWidget(self.file_count_label)
+        self.file_count_label = QLabel("0 files")
+        self.file_count_label.setObjectName("fileCountLabel")
+        self.status_bar.addPermanentWidget(self._with_emoji("📄", self.file_count_label, 14))
+    
+    def _set_status_state(self, state: str) -> None:
+        """Switch the status label style via its "state" property."""
+        # Re-polishing restyles the label, so skip it when nothing changes
+        if self.status_label.property("state") == state:
+            return
+        
+        self.status_label.setProperty("state", state)
+        
+        # Dynamic properties only take effect after a re-polish
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
     
     def _connect_signals(self) -> None:
         """Connect widget signals."""
@@ -523,15 +596,9 @@ class MainWindow(QMainWindow):
     
     def _restore_window_state(self) -> None:
         """Restore window size and position from settings."""
-        self.resize(
-            self.settings.value("window/width", 1200, type=int),
-            self.settings.value("window/height", 800, type=int)
-        )
-        
-        # Restore window position if available
-        pos = self.settings.value("window/position")
-        if pos:
-            self.move(pos)
+        geometry = self.settings.value("window/geometry")
+        if not geometry or not self.restoreGeometry(geometry):
+            self.resize(1200, 800)
         
         # Restore window state
         state = self.settings.value("window/state")
@@ -540,105 +607,121 @@ class MainWindow(QMainWindow):
     
     def _save_window_state(self) -> None:
         """Save window size and position to settings."""
-        self.settings.setValue("window/width", self.width())
-        self.settings.setValue("window/height", self.height())
-        self.settings.setValue("window/position", self.pos())
-        self.settings.setValue("window/state", self.saveState())
+        self.settings.beginGroup("window")
+        self.settings.setValue("geometry", self.saveGeometry())
+        self.settings.setValue("state", self.saveState())
+        
+        # Drop the keys older versions stored separately
+        for key in ("width", "height", "position"):
+            self.settings.remove(key)
+        self.settings.endGroup()
+        
+        # Write everything to disk in one pass
+        self.settings.sync()
     
+    @Slot()
     def _add_files_dialog(self) -> None:
         """Show file dialog to add files."""
-        file_dialog = QFileDialog(self)
-        file_dialog.setFileMode(QFileDialog.ExistingFiles)
-        file_dialog.setNameFilter(
-            "Media Files (*.wav *.mp3 *.flac *.aac *.ogg *.m4a *.mp4 *.avi *.mkv *.mov *.wmv *.webm);;"
-            "Audio Files (*.wav *.mp3 *.flac *.aac *.ogg *.m4a);;"
-            "Video Files (*.mp4 *.avi *.mkv *.mov *.wmv *.webm);;"
-            "All Files (*.*)"
+        files, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Add Files",
+            self._last_dialog_dir,
+            self.MEDIA_FILE_FILTER
         )
         
-        if file_dialog.exec():
-            files = [Path(f) for f in file_dialog.selectedFiles()]
-            self._add_files(files)
+        if files:
+            self._last_dialog_dir = str(Path(files[0]).parent)
+            self._add_files([Path(f) for f in files])
     
+    @Slot()
     def _add_folder_dialog(self) -> None:
         """Show folder dialog to add all media files from a folder."""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Folder",
-            "",
+            self._last_dialog_dir,
             QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
         )
         
         if folder:
-            folder_path = Path(folder)
-            media_files = []
-            
-            # Find all media files in folder and subfolders
-            for pattern in ["*.wav", "*.mp3", "*.flac", "*.aac", "*.ogg", "*.m4a", 
-                          "*.mp4", "*.avi", "*.mkv", "*.mov", "*.wmv", "*.webm"]:
-                media_files.extend(folder_path.rglob(pattern))
+            self._last_dialog_dir = folder
             
-            if media_files:
-                self._add_files(media_files)
-                self.status_label.setText(f"Added {len(media_files)} files from {folder}")
-            else:
-                QMessageBox.information(
-                    self,
-                    "No Media Files",
-                    f"No supported media files found in {folder}"
-                )
+            # Find all media files in folder and subfolders off the GUI thread
+            self._start_scan(_ScanTask(folder=Path(folder)))
     
     def _add_files(self, files: List[Path]) -> None:
-        """Add files to the processing queue."""
-        valid_files = [f for f in files if f.exists() and is_media_file(f)]
-        
+        """Validate files in the background and add them to the processing queue."""
+        self._start_scan(_ScanTask(files=list(files)))
+    
+    def _start_scan(self, task: _ScanTask) -> None:
+        """Run a scan task on the thread pool and report back to this window."""
+        task.signals.finished.connect(self._on_scan_finished)
+        QThreadPool.globalInstance().start(task)
+    
+    @Slot(list, int, str)
+    def _on_scan_finished(self, valid_files: List[Path], skipped: int, folder: str) -> None:
+        """Queue the files found by a background scan."""
         if valid_files:
             self.files_added.emit(valid_files)
             logger.info(f"Added {len(valid_files)} files to queue")
+            if folder:
+                self.status_label.setText(f"Added {len(valid_files)} files from {folder}")
+        elif folder:
+            QMessageBox.information(
+                self,
+                "No Media Files",
+                f"No supported media files found in {folder}"
+            )
         
-        invalid_count = len(files) - len(valid_files)
-        if invalid_count > 0:
-            logger.warning(f"Skipped {invalid_count} invalid or unsupported files")
+        if skipped > 0:
+            logger.warning(f"Skipped {skipped} invalid or unsupported files")
     
+    @Slot(int)
     def _update_file_count(self, count: int) -> None:
         """Update file count in status bar."""
-        self.file_count_label.setText(f"📄 {count} files")
+        self.file_count_label.setText(f"{count} files")
+        
+        # Forget cached validation results once the list is emptied
+        if count == 0:
+            _validated_paths.clear()
     
+    @Slot(object)
     def _update_preview(self, file_path: Optional[Path]) -> None:
         """Update preview panel when selection changes."""
-        if file_path:
+        self.preview_action.setEnabled(bool(file_path))
+        
+        # Defer loading until the preview panel exists
+        if self.preview_panel is None:
+            self._pending_preview_file = file_path
+        elif file_path:
             self.preview_panel.load_file(file_path)
-            self.preview_action.setEnabled(True)
         else:
             self.preview_panel.clear()
-            self.preview_action.setEnabled(False)
     
+    @Slot()
     def _preview_current_selection(self) -> None:
         """Preview processing on currently selected file."""
         current_file = self.file_list.get_current_file()
         if current_file:
             settings = self.settings_panel.get_current_settings()
-            self.preview_panel.preview_processing(current_file, settings)
+            self._ensure_preview_panel().preview_processing(current_file, settings)
     
+    @Slot(dict)
     def _apply_settings(self, settings: Dict[str, Any]) -> None:
         """Apply settings changes."""
         # Update batch processor with new settings
         self.batch_processor.update_settings(settings)
         logger.debug("Settings applied")
     
+    @Slot()
     def _on_processing_started(self) -> None:
         """Handle processing start."""
         self.status_label.setText("⚡ Processing...")
-        self.status_label.setStyleSheet("font-size: 14px; color: #5865f2;")
+        self._set_status_state("processing")
         self.progress_bar.setVisible(True)
         
-        # Add pulsing animation to progress bar
-        self.progress_animation = QPropertyAnimation(self.progress_bar, b"styleSheet")
-        self.progress_animation.setDuration(1000)
-        self.progress_animation.setLoopCount(-1)  # Infinite loop
-        self.progress_animation.setKeyValueAt(0, self.progress_bar.styleSheet())
-        self.progress_animation.setKeyValueAt(0.5, self.progress_bar.styleSheet() + "opacity: 0.7;")
-        self.progress_animation.setKeyValueAt(1, self.progress_bar.styleSheet())
+        # Start pulsing the progress bar
+        self.progress_effect.setEnabled(True)
         self.progress_animation.start()
         
         # Focus on logs to show processing activity (logs are now always visible)
@@ -651,15 +734,22 @@ class MainWindow(QMainWindow):
         
         self.processing_started.emit()
     
+    @Slot()
     def _on_processing_finished(self) -> None:
         """Handle processing completion."""
+        # Drop any progress update still waiting to be shown
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._shown_progress = None
+        
         self.status_label.setText("✅ Processing complete")
-        self.status_label.setStyleSheet("font-size: 14px; color: #57f287;")
+        self._set_status_state("done")
         self.progress_bar.setVisible(False)
         
-        # Stop animation if it exists
-        if hasattr(self, 'progress_animation'):
-            self.progress_animation.stop()
+        # Stop pulsing and drop the offscreen effect pass
+        self.progress_animation.stop()
+        self.progress_effect.setOpacity(1.0)
+        self.progress_effect.setEnabled(False)
         
         # Update menu states
         self.start_batch_action.setEnabled(True)
@@ -668,14 +758,29 @@ class MainWindow(QMainWindow):
         
         self.processing_stopped.emit()
     
+    @Slot(int, int, str)
     def _update_progress(self, current: int, total: int, message: str) -> None:
-        """Update progress bar and status."""
+        """Queue a progress update for the next flush."""
         if total > 0:
-            self.progress_bar.setMaximum(total)
-            self.progress_bar.setValue(current)
-            self.status_label.setText(f"⚡ Processing {current}/{total}: {message}")
-            self.status_label.setStyleSheet("font-size: 14px; color: #5865f2;")
+            self._pending_progress = (current, total, message)
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+    
+    @Slot()
+    def _flush_progress(self) -> None:
+        """Show the latest queued progress update."""
+        progress = self._pending_progress
+        self._pending_progress = None
+        if progress is None or progress == self._shown_progress:
+            return
+        
+        current, total, message = progress
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.status_label.setText(f"⚡ Processing {current}/{total}: {message}")
+        self._shown_progress = progress
     
+    @Slot()
     def _show_preferences(self) -> None:
         """Show preferences dialog."""
         dialog = PreferencesDialog(self, self.config_dir)
@@ -683,6 +788,7 @@ class MainWindow(QMainWindow):
             # Apply preferences
             logger.info("Preferences updated")
     
+    @Slot()
     def _show_about(self) -> None:
         """Show about dialog."""
         QMessageBox.about(
@@ -710,10 +816,11 @@ class MainWindow(QMainWindow):
     
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop events."""
-        files = []
-        for url in event.mimeData().urls():
-            if url.isLocalFile():
-                files.append(Path(url.toLocalFile()))
+        # Filter by extension here so unsupported drops never reach the scan
+        files = [
+            Path(local) for local in (url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile())
+            if os.path.splitext(local)[1].lower() in MEDIA_EXTENSIONS
+        ]
         
         if files:
             self._add_files(files)
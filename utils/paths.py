@@ -5,6 +5,16 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 
+# Supported media extensions (lowercase, with leading dot)
+AUDIO_EXTENSIONS = frozenset({
+    '.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a', '.wma', '.aiff'
+})
+VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'
+})
+MEDIA_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to be safe for filesystem use.
@@ -113,23 +123,17 @@ def get_unique_path(path: Path) -> Path:
 
 def is_audio_file(path: Path) -> bool:
     """Check if file is a supported audio format."""
-    audio_extensions = {
-        '.wav', '.mp3', '.flac', '.aac', '.ogg', '.m4a', '.wma', '.aiff'
-    }
-    return path.suffix.lower() in audio_extensions
+    return path.suffix.lower() in AUDIO_EXTENSIONS
 
 
 def is_video_file(path: Path) -> bool:
     """Check if file is a supported video format."""
-    video_extensions = {
-        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'
-    }
-    return path.suffix.lower() in video_extensions
+    return path.suffix.lower() in VIDEO_EXTENSIONS
 
 
 def is_media_file(path: Path) -> bool:
     """Check if file is a supported media format (audio or video)."""
-    return is_audio_file(path) or is_video_file(path)
+    return path.suffix.lower() in MEDIA_EXTENSIONS
 
 
 def get_temp_path(original_path: Path, suffix: str = "_temp") -> Path: